@@ -0,0 +1,70 @@
+"""Micro-benchmark for the forecast columns sent to sensors and the card.
+
+Compares rebuilding the columnar forecast on every access with the
+coordinator's per-payload memoized ``columns``, and reports the JSON size
+of the columnar payload against the row-per-minute attribute format it
+replaced.
+
+Run from the repository root with Home Assistant installed:
+
+    python benchmarks/bench_columns.py
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from custom_components.precipitation_radial.coordinator import (  # noqa: E402
+    HourlyCoordinator,
+    MinutelyCoordinator,
+    _split_payload,
+)
+
+FIXTURE = ROOT / "benchmarks" / "fixtures" / "forecast_us.json"
+NUMBER = 2000
+
+
+def _coordinator(cls, data: dict):
+    """Return a coordinator holding data, without a running Home Assistant."""
+    coordinator = cls.__new__(cls)
+    coordinator.data = data
+    coordinator._columns = {}
+    coordinator._columns_source = None
+    return coordinator
+
+
+def _rows(columns: dict[str, list]) -> list[dict]:
+    """Return columns as one dict per row (the previous attribute format)."""
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+
+def main() -> None:
+    parts = _split_payload(json.loads(FIXTURE.read_text()))
+    for cls, block in (
+        (MinutelyCoordinator, "minutely"),
+        (HourlyCoordinator, "hourly"),
+    ):
+        coordinator = _coordinator(cls, parts[block])
+        columns = coordinator.columns  # prime the cache
+
+        rebuild = timeit.timeit(
+            lambda: coordinator._build_columns(coordinator.data), number=NUMBER
+        )
+        cached = timeit.timeit(lambda: coordinator.columns, number=NUMBER)
+        rows_bytes = len(json.dumps(_rows(columns)))
+        columns_bytes = len(json.dumps(columns))
+        print(
+            f"{cls.__name__:<20} rebuild {rebuild / NUMBER * 1e6:8.2f} us/access"
+            f"   cached {cached / NUMBER * 1e6:6.2f} us/access"
+            f"   rows {rows_bytes:6d} B   columns {columns_bytes:6d} B"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+"""Offline load test of the integration against a local PirateWeather stand-in.
+
+Starts a local aiohttp server that answers forecast requests from
+``benchmarks/fixtures/forecast_us.json`` (honouring ``exclude``) and
+Nominatim reverse lookups, with configurable latency and error rate. The
+integration's endpoints are pointed at it, then N config entries are set
+up through ``async_setup_entry``, the coordinators and the sensor platform
+of a test Home Assistant instance and polled for a number of rounds.
+
+Reported per run:
+
+- setup time per entry (as measured by ``async_setup_entry``)
+- per-poll latency of the coordinators' refreshes
+- event-loop blocking: the longest stall and the total time stalled
+- memory retained per entry after setup (tracemalloc)
+- recorder write volume: state changes and their serialized size, which is
+  what the recorder would persist
+
+Each entry sits in its own grid cell and the fetch reuse and grid-cell
+cache windows are disabled, so every refresh reaches the stand-in. Unless
+``--static`` is given the stand-in rotates between time-shifted copies of
+the fixture so responses are never byte-identical.
+
+Run from the repository root with Home Assistant and
+pytest-homeassistant-custom-component installed:
+
+    python benchmarks/bench_load.py --entries 20 --rounds 10 --latency 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import random
+import socket
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Awaitable
+from pathlib import Path
+from typing import Any
+
+from aiohttp import hdrs, web
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from homeassistant import loader  # noqa: E402
+from homeassistant.const import EVENT_STATE_CHANGED  # noqa: E402
+from homeassistant.core import Event, HomeAssistant, callback  # noqa: E402
+from homeassistant.setup import async_setup_component  # noqa: E402
+from pytest_homeassistant_custom_component.common import (  # noqa: E402
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from custom_components.precipitation_radial import (  # noqa: E402
+    coordinator,
+    geocode,
+)
+from custom_components.precipitation_radial.const import (  # noqa: E402
+    CONF_API_KEY,
+    CONF_LATITUDE,
+    CONF_LONGITUDE,
+    DOMAIN,
+)
+
+FIXTURE = ROOT / "benchmarks" / "fixtures" / "forecast_us.json"
+NOMINATIM_REPLY = {"address": {"city": "Benchmark City", "state": "Offline"}}
+# Time-shifted copies of the fixture the stand-in rotates between
+VARIANTS = 16
+# Event-loop lateness below this is scheduling noise, not blocking
+STALL_THRESHOLD = 0.005
+HEARTBEAT = 0.001
+
+
+class StandIn:
+    """Local PirateWeather and Nominatim replacement."""
+
+    def __init__(
+        self, latency: float, jitter: float, error_rate: float, static: bool
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.static = static
+        self.fixture = FIXTURE.read_text()
+        self.bodies: dict[tuple[str, int], bytes] = {}
+        self.stats = {"forecast": 0, "not_modified": 0, "errors": 0, "geocode": 0}
+        self._runner: web.AppRunner | None = None
+
+    def _body(self, exclude: str, variant: int) -> bytes:
+        """Return the fixture without the excluded blocks, shifted in time."""
+        key = (exclude, variant)
+        if key not in self.bodies:
+            excluded = exclude.split(",")
+            data = {
+                name: block
+                for name, block in json.loads(self.fixture).items()
+                if name not in excluded
+            }
+            for block in data.values():
+                if isinstance(block, dict):
+                    for row in block.get("data", [block]):
+                        if "time" in row:
+                            row["time"] += variant * 60
+            self.bodies[key] = json.dumps(data).encode()
+        return self.bodies[key]
+
+    async def _delay(self) -> None:
+        await asyncio.sleep(max(0.0, random.gauss(self.latency, self.jitter)))
+
+    async def forecast(self, request: web.Request) -> web.Response:
+        await self._delay()
+        self.stats["forecast"] += 1
+        headers = {"RateLimit-Limit": "20000", "RateLimit-Remaining": "19000"}
+        if random.random() < self.error_rate:
+            self.stats["errors"] += 1
+            return web.Response(status=503, headers=headers)
+        variant = 0 if self.static else self.stats["forecast"] % VARIANTS
+        etag = f'"{variant}"'
+        if request.headers.get(hdrs.IF_NONE_MATCH) == etag:
+            self.stats["not_modified"] += 1
+            return web.Response(status=304, headers=headers)
+        return web.Response(
+            body=self._body(request.query.get("exclude", ""), variant),
+            content_type="application/json",
+            headers={**headers, hdrs.ETAG: etag},
+        )
+
+    async def reverse(self, request: web.Request) -> web.Response:
+        await self._delay()
+        self.stats["geocode"] += 1
+        return web.json_response(NOMINATIM_REPLY)
+
+    async def start(self) -> str:
+        """Start serving and return the base URL."""
+        # Build every response up front so it does not count as loop blocking
+        for exclude in coordinator._EXCLUDES.values():
+            for variant in range(VARIANTS):
+                self._body(exclude, variant)
+        app = web.Application()
+        app.router.add_get("/forecast/{api_key}/{location}", self.forecast)
+        app.router.add_get("/reverse", self.reverse)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, "127.0.0.1", 0).start()
+        host, port = self._runner.addresses[0][:2]
+        return f"http://{host}:{port}"
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+
+class LoopMonitor:
+    """Measure how long the event loop is kept from running a heartbeat."""
+
+    def __init__(self) -> None:
+        self.longest = 0.0
+        self.total = 0.0
+        self._task: asyncio.Task | None = None
+
+    async def _beat(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(HEARTBEAT)
+            late = time.perf_counter() - start - HEARTBEAT
+            if late > STALL_THRESHOLD:
+                self.longest = max(self.longest, late)
+                self.total += late
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._beat())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+def _unused_port() -> int:
+    """Return a free local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _timed(awaitable: Awaitable[Any], latencies: list[float]) -> None:
+    """Await and record how long it took."""
+    start = time.perf_counter()
+    await awaitable
+    latencies.append(time.perf_counter() - start)
+
+
+def _percentiles(values: list[float]) -> str:
+    """Return p50/p95/max of durations in milliseconds."""
+    if len(values) < 2:
+        return "n/a"
+    cuts = statistics.quantiles(values, n=20)
+    return (
+        f"p50 {statistics.median(values) * 1000:7.1f} ms"
+        f"   p95 {cuts[18] * 1000:7.1f} ms"
+        f"   max {max(values) * 1000:7.1f} ms"
+    )
+
+
+async def _run(args: argparse.Namespace, hass: HomeAssistant, base_url: str) -> None:
+    # Point the integration at the stand-in and let every refresh reach it
+    coordinator.API_ENDPOINT = f"{base_url}/forecast"
+    coordinator.FETCH_REUSE_WINDOW = 0
+    coordinator.FORECAST_CACHE_MAX_AGE = 0
+    geocode.NOMINATIM_ENDPOINT = f"{base_url}/reverse"
+    geocode.GEOCODE_MIN_REQUEST_SPACING = 0
+
+    hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+    await async_setup_component(
+        hass,
+        "http",
+        {"http": {"server_host": "127.0.0.1", "server_port": _unused_port()}},
+    )
+
+    writes = {"states": 0, "bytes": 0}
+
+    @callback
+    def count_write(event: Event) -> None:
+        if (new_state := event.data["new_state"]) is not None:
+            writes["states"] += 1
+            writes["bytes"] += len(new_state.as_dict_json)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, count_write)
+
+    monitor = LoopMonitor()
+    monitor.start()
+
+    entries = [
+        MockConfigEntry(
+            domain=DOMAIN,
+            title=f"Bench {i}",
+            data={
+                CONF_API_KEY: "bench",
+                CONF_LATITUDE: round(25 + (i // 40) * 0.5, 3),
+                CONF_LONGITUDE: round(-120 + (i % 40) * 0.5, 3),
+            },
+        )
+        for i in range(args.entries)
+    ]
+    if args.memory:
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+    wall = time.perf_counter()
+    for entry in entries:
+        entry.add_to_hass(hass)
+        if not await hass.config_entries.async_setup(entry.entry_id):
+            raise RuntimeError(f"Setup of {entry.title} failed")
+    await hass.async_block_till_done()
+    wall = time.perf_counter() - wall
+    if args.memory:
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+
+    entry_data = [hass.data[DOMAIN][entry.entry_id] for entry in entries]
+    setup = [data["setup_seconds"] for data in entry_data]
+    setup_writes = dict(writes)
+
+    latencies: list[float] = []
+    for _ in range(args.rounds):
+        await asyncio.gather(
+            *(
+                _timed(data[block].async_refresh(), latencies)
+                for data in entry_data
+                for block in ("minutely", "hourly")
+            )
+        )
+        await hass.async_block_till_done()
+    await monitor.stop()
+
+    fetch = {
+        name: sum(data["fetcher"].stats[name] for data in entry_data)
+        for name in entry_data[0]["fetcher"].stats
+    }
+    polls = writes["states"] - setup_writes["states"]
+    print(f"entries {args.entries}   rounds {args.rounds}")
+    print(f"setup        total {wall:6.2f} s   per entry {_percentiles(setup)}")
+    print(f"poll         {_percentiles(latencies)}")
+    print(
+        f"loop stalls  longest {monitor.longest * 1000:7.1f} ms"
+        f"   total {monitor.total * 1000:8.1f} ms"
+    )
+    if args.memory:
+        print(f"memory       {retained / args.entries / 1024:8.1f} KiB per entry")
+    print(
+        f"recorder     setup {setup_writes['states']} states"
+        f" ({setup_writes['bytes'] / 1024:.1f} KiB)"
+        f"   polls {polls} states"
+        f" ({(writes['bytes'] - setup_writes['bytes']) / 1024:.1f} KiB)"
+    )
+    print(f"fetch        {fetch}")
+
+    for entry in entries:
+        await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def main(args: argparse.Namespace) -> None:
+    stand_in = StandIn(
+        args.latency / 1000, args.jitter / 1000, args.error_rate, args.static
+    )
+    base_url = await stand_in.start()
+    try:
+        with tempfile.TemporaryDirectory() as config_dir:
+            async with async_test_home_assistant(config_dir=config_dir) as hass:
+                await _run(args, hass, base_url)
+                await hass.async_stop(force=True)
+    finally:
+        await stand_in.stop()
+    print(f"stand-in     {stand_in.stats}")
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=20, help="mean ms")
+    parser.add_argument("--jitter", type=float, default=5, help="ms std dev")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--static", action="store_true", help="serve one unchanging response"
+    )
+    parser.add_argument(
+        "--no-memory",
+        dest="memory",
+        action="store_false",
+        help="skip tracemalloc, which slows setup down",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(_parse_args()))
@@ -0,0 +1,81 @@
+"""Memory benchmark for the forecast data each config entry keeps.
+
+Compares the memory retained per entry by the decoded PirateWeather JSON
+the coordinators used to hold (nested dicts for the minutely, currently,
+hourly and daily blocks) with the compact typed-array representation they
+parse it into now. Sizes are measured with tracemalloc after the decoded
+response has been released.
+
+Run from the repository root with Home Assistant installed:
+
+    python benchmarks/bench_memory.py
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import sys
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from custom_components.precipitation_radial.forecast import (  # noqa: E402
+    HourlyForecast,
+    MinutelyForecast,
+)
+
+FIXTURE = ROOT / "benchmarks" / "fixtures" / "forecast_us.json"
+ENTRIES = 50
+
+
+def _nested(text: str) -> dict[str, Any]:
+    """Return the blocks as the coordinators previously kept them."""
+    data = json.loads(text)
+    return {
+        "minutely": {"minutely": data.get("minutely", {})},
+        "hourly": {
+            "currently": data.get("currently", {}),
+            "hourly": data.get("hourly", {}),
+            "daily": data.get("daily", {}),
+        },
+    }
+
+
+def _compact(text: str) -> dict[str, Any]:
+    """Return the blocks as the coordinators keep them now."""
+    data = json.loads(text)
+    return {
+        "minutely": MinutelyForecast.from_json(data.get("minutely", {})),
+        "hourly": HourlyForecast.from_json(data),
+    }
+
+
+def _retained(build: Callable[[str], dict[str, Any]], text: str) -> float:
+    """Return the mean bytes retained per entry for ENTRIES parsed responses."""
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    entries = [build(text) for _ in range(ENTRIES)]
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del entries
+    return retained / ENTRIES
+
+
+def main() -> None:
+    text = FIXTURE.read_text()
+    nested = _retained(_nested, text)
+    compact = _retained(_compact, text)
+    print(f"response          {len(text):8d} B")
+    print(f"nested dicts      {nested:8.0f} B/entry")
+    print(f"typed arrays      {compact:8.0f} B/entry   ({nested / compact:.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,29 +2,65 @@
 
 from __future__ import annotations
 
-import glob
-import hashlib
-import os
+import asyncio
+import time
+from functools import partial
+from typing import Any
 
 import voluptuous as vol
 
-import homeassistant.helpers.aiohttp_client
 import homeassistant.helpers.config_validation as cv
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
-
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
+
+from . import websocket_api
+from .card import async_register_card
 from .const import (
+    CONF_ADAPTIVE_POLLING,
     CONF_API_KEY,
+    CONF_DAILY_CALL_BUDGET,
+    CONF_FAVORITES,
+    CONF_FOLLOW_ENTITY,
     CONF_HOURLY_INTERVAL,
     CONF_LATITUDE,
     CONF_LONGITUDE,
     CONF_MINUTELY_INTERVAL,
+    CONF_MINUTELY_MAX_INTERVAL,
+    CONF_MINUTELY_MIN_INTERVAL,
+    CONF_UNIT_SYSTEM,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_DAILY_CALL_BUDGET,
     DEFAULT_HOURLY_INTERVAL,
     DEFAULT_MINUTELY_INTERVAL,
+    DEFAULT_MINUTELY_MAX_INTERVAL,
+    DEFAULT_MINUTELY_MIN_INTERVAL,
+    DEFAULT_UNIT_SYSTEM,
     DOMAIN,
     LOGGER,
+    SIGNAL_ENTRY_UNLOADED,
+    SIGNAL_LOCATION_NAME,
+    STORAGE_KEY_FORECAST,
+    STORAGE_VERSION_FORECAST,
+)
+from .coordinator import (
+    BLOCK_HOURLY,
+    BLOCK_MINUTELY,
+    ForecastFetcher,
+    HourlyCoordinator,
+    MinutelyCoordinator,
 )
-from .coordinator import HourlyCoordinator, MinutelyCoordinator
+from .favorites import FavoriteWarmer
+from .follow import LocationFollower, tracked_position
+from .geocode import async_get_geocoder
+from .polling import AdaptivePolling
+from .quota import async_get_quota
+from .scheduler import get_poll_scheduler
+from .services import async_setup_services
+from .util import grid_center, parse_coordinates
 
 PLATFORMS = ["sensor"]
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
@@ -38,153 +74,162 @@ SERVICE_UPDATE_LOCATION_SCHEMA = vol.Schema(
 )
 
 
-async def _register_card(hass: HomeAssistant) -> None:
-    """Copy card JS to www/ and register as a lovelace resource."""
-    import shutil
-
-    src = os.path.join(os.path.dirname(__file__), "www", "precipitation-radial-card.js")
-    dst_dir = os.path.join(hass.config.config_dir, "www", "community", "precipitation-radial-card")
-
-    def _copy_card() -> str:
-        """Synchronous file operations for executor."""
-        os.makedirs(dst_dir, exist_ok=True)
-
-        with open(src, "rb") as f:
-            ver = hashlib.md5(f.read()).hexdigest()[:8]
-
-        dst_filename = f"precipitation-radial-card-{ver}.js"
-        dst = os.path.join(dst_dir, dst_filename)
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Precipitation Radial Card component."""
+    websocket_api.async_setup(hass)
+    async_setup_services(hass)
+    return True
 
-        for old in glob.glob(os.path.join(dst_dir, "precipitation-radial-card*.js")):
-            if old != dst:
-                os.remove(old)
 
-        shutil.copy2(src, dst)
-        return dst_filename
+async def _async_resolve_location_name(
+    hass: HomeAssistant, entry: ConfigEntry, latitude: float, longitude: float
+) -> None:
+    """Reverse geocode in the background and push the name to the sensors."""
+    start = time.monotonic()
+    geocoder = await async_get_geocoder(hass)
+    location_name = await geocoder.async_reverse_geocode(latitude, longitude)
+    elapsed = time.monotonic() - start
+    LOGGER.debug("Reverse geocode for %s took %.3f s", entry.title, elapsed)
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if entry_data is None:
+        return
+    entry_data["fetcher"].metrics.record("geocode", elapsed)
+    entry_data["location_name"] = location_name
+    async_dispatcher_send(
+        hass, SIGNAL_LOCATION_NAME.format(entry.entry_id), location_name
+    )
 
-    dst_filename = await hass.async_add_executor_job(_copy_card)
 
-    url_with_ver = f"/local/community/precipitation-radial-card/{dst_filename}"
+def _entry_settings(entry: ConfigEntry) -> dict[str, Any]:
+    """Return the effective settings of a config entry."""
+    return {
+        CONF_API_KEY: entry.data[CONF_API_KEY],
+        CONF_LATITUDE: entry.options.get(CONF_LATITUDE, entry.data[CONF_LATITUDE]),
+        CONF_LONGITUDE: entry.options.get(CONF_LONGITUDE, entry.data[CONF_LONGITUDE]),
+        CONF_MINUTELY_INTERVAL: entry.options.get(
+            CONF_MINUTELY_INTERVAL, DEFAULT_MINUTELY_INTERVAL
+        ),
+        CONF_HOURLY_INTERVAL: entry.options.get(
+            CONF_HOURLY_INTERVAL, DEFAULT_HOURLY_INTERVAL
+        ),
+        CONF_ADAPTIVE_POLLING: entry.options.get(
+            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+        ),
+        CONF_MINUTELY_MIN_INTERVAL: entry.options.get(
+            CONF_MINUTELY_MIN_INTERVAL, DEFAULT_MINUTELY_MIN_INTERVAL
+        ),
+        CONF_MINUTELY_MAX_INTERVAL: entry.options.get(
+            CONF_MINUTELY_MAX_INTERVAL, DEFAULT_MINUTELY_MAX_INTERVAL
+        ),
+        CONF_DAILY_CALL_BUDGET: entry.options.get(
+            CONF_DAILY_CALL_BUDGET, DEFAULT_DAILY_CALL_BUDGET
+        ),
+        CONF_FOLLOW_ENTITY: entry.options.get(CONF_FOLLOW_ENTITY),
+        CONF_FAVORITES: entry.options.get(CONF_FAVORITES, []),
+        CONF_UNIT_SYSTEM: entry.options.get(CONF_UNIT_SYSTEM, DEFAULT_UNIT_SYSTEM),
+    }
 
-    # Register lovelace resource
-    from homeassistant.components.lovelace.resources import ResourceStorageCollection
 
-    lovelace = hass.data.get("lovelace")
-    if lovelace is not None:
-        resources: ResourceStorageCollection = (
-            lovelace.resources
-            if hasattr(lovelace, "resources")
-            else lovelace["resources"]
-        )
-        await resources.async_get_info()
-
-        # Check if resource already registered
-        found = False
-        for item in resources.async_items():
-            if "precipitation-radial-card" in item.get("url", ""):
-                found = True
-                if item["url"] != url_with_ver:
-                    if isinstance(resources, ResourceStorageCollection):
-                        await resources.async_update_item(
-                            item["id"],
-                            {"res_type": "module", "url": url_with_ver},
-                        )
-                    else:
-                        item["url"] = url_with_ver
-                break
-
-        if not found:
-            if isinstance(resources, ResourceStorageCollection):
-                await resources.async_create_item(
-                    {"res_type": "module", "url": url_with_ver}
-                )
-            else:
-                from homeassistant.components.frontend import add_extra_js_url
-
-                add_extra_js_url(hass, url_with_ver)
-
-
-async def _reverse_geocode(hass: HomeAssistant, latitude: float, longitude: float) -> str:
-    """Reverse geocode lat/lon to a 'City, State/Region' string via Nominatim."""
-    session = homeassistant.helpers.aiohttp_client.async_get_clientsession(hass)
-    url = (
-        f"https://nominatim.openstreetmap.org/reverse"
-        f"?lat={latitude}&lon={longitude}&format=json&zoom=10"
+def _adaptive_polling(settings: dict[str, Any]) -> AdaptivePolling | None:
+    """Return the adaptive minutely polling policy, if enabled."""
+    if not settings[CONF_ADAPTIVE_POLLING]:
+        return None
+    return AdaptivePolling(
+        settings[CONF_MINUTELY_MIN_INTERVAL],
+        settings[CONF_MINUTELY_MAX_INTERVAL],
+        settings[CONF_DAILY_CALL_BUDGET],
     )
-    headers = {"User-Agent": "HomeAssistant-PrecipitationRadialCard/1.0"}
-    try:
-        async with session.get(url, headers=headers, timeout=10) as resp:
-            if resp.status != 200:
-                return ""
-            data = await resp.json(content_type=None)
-            addr = data.get("address", {})
-            city = (
-                addr.get("city")
-                or addr.get("town")
-                or addr.get("village")
-                or addr.get("municipality")
-                or addr.get("hamlet")
-                or ""
-            )
-            region = (
-                addr.get("state")
-                or addr.get("province")
-                or addr.get("region")
-                or addr.get("county")
-                or ""
-            )
-            parts = [p for p in (city, region) if p]
-            return ", ".join(parts)
-    except Exception:
-        LOGGER.debug("Reverse geocode failed for %s,%s", latitude, longitude)
-        return ""
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Precipitation Radial Card from a config entry."""
+    setup_start = time.monotonic()
+    card_seconds = None
     if f"{DOMAIN}_card_registered" not in hass.data:
-        await _register_card(hass)
+        await async_register_card(hass)
         hass.data[f"{DOMAIN}_card_registered"] = True
-
-    api_key = entry.data[CONF_API_KEY]
-    latitude = entry.options.get(CONF_LATITUDE, entry.data[CONF_LATITUDE])
-    longitude = entry.options.get(CONF_LONGITUDE, entry.data[CONF_LONGITUDE])
-
-    minutely_interval = entry.options.get(
-        CONF_MINUTELY_INTERVAL, DEFAULT_MINUTELY_INTERVAL
+        card_seconds = time.monotonic() - setup_start
+
+    settings = _entry_settings(entry)
+    api_key = settings[CONF_API_KEY]
+    latitude = settings[CONF_LATITUDE]
+    longitude = settings[CONF_LONGITUDE]
+    if settings[CONF_FOLLOW_ENTITY] and (
+        position := tracked_position(hass.states.get(settings[CONF_FOLLOW_ENTITY]))
+    ):
+        # Start where the followed tracker is rather than retargeting later
+        latitude, longitude = grid_center(*position)
+    minutely_interval = settings[CONF_MINUTELY_INTERVAL]
+    hourly_interval = settings[CONF_HOURLY_INTERVAL]
+
+    # Hourly refreshes ride along with minutely ones, so the minutely interval
+    # is this entry's nominal upstream call rate
+    quota = await async_get_quota(hass, api_key)
+    quota.set_demand(entry.entry_id, minutely_interval)
+    entry.async_on_unload(lambda: quota.remove_demand(entry.entry_id))
+
+    fetcher = ForecastFetcher(
+        hass, entry.entry_id, api_key, latitude, longitude, quota
     )
-    hourly_interval = entry.options.get(
-        CONF_HOURLY_INTERVAL, DEFAULT_HOURLY_INTERVAL
-    )
-
     minutely_coord = MinutelyCoordinator(
-        hass, api_key, latitude, longitude, minutely_interval
-    )
-    hourly_coord = HourlyCoordinator(
-        hass, api_key, latitude, longitude, hourly_interval
+        hass, fetcher, minutely_interval, _adaptive_polling(settings)
     )
-
-    await minutely_coord.async_config_entry_first_refresh()
-    await hourly_coord.async_config_entry_first_refresh()
-
-    location_name = await _reverse_geocode(hass, latitude, longitude)
+    hourly_coord = HourlyCoordinator(hass, fetcher, hourly_interval)
+
+    # Stagger this entry's polls against those of every other entry
+    scheduler = get_poll_scheduler(hass)
+    for coord in (minutely_coord, hourly_coord):
+        scheduler.add(coord)
+        entry.async_on_unload(partial(scheduler.remove, coord))
+
+    # Seed from the saved forecast when it is fresh enough and let the
+    # scheduler pick its next poll; otherwise block on a first refresh. Both
+    # first refreshes run concurrently and share one combined upstream call.
+    if card_seconds is not None:
+        fetcher.metrics.record("register_card", card_seconds)
+    restored = await fetcher.async_restore()
+    first_refreshes = [
+        coord.async_config_entry_first_refresh()
+        for block, coord in (
+            (BLOCK_MINUTELY, minutely_coord),
+            (BLOCK_HOURLY, hourly_coord),
+        )
+        if block not in restored
+    ]
+    await asyncio.gather(*first_refreshes)
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
+        "fetcher": fetcher,
         "minutely": minutely_coord,
         "hourly": hourly_coord,
-        "location_name": location_name,
+        "settings": settings,
+        "location_name": "",
     }
 
+    # The place name is cosmetic; resolve it off the setup critical path
+    entry.async_create_background_task(
+        hass,
+        _async_resolve_location_name(hass, entry, latitude, longitude),
+        f"{DOMAIN} reverse geocode",
+    )
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Keep the 60-minute window anchored to now between polls
+    entry.async_on_unload(
+        async_track_time_change(hass, minutely_coord.async_advance_window, second=0)
+    )
+
+    _async_follow(hass, entry, settings[CONF_FOLLOW_ENTITY])
+    _async_prewarm(hass, entry, settings[CONF_FAVORITES])
     entry.async_on_unload(entry.add_update_listener(_async_options_updated))
 
     # Register update_location service (only once across all entries)
     if not hass.services.has_service(DOMAIN, SERVICE_UPDATE_LOCATION):
 
         async def handle_update_location(call: ServiceCall) -> None:
-            """Update lat/lon in the first config entry's options and reload."""
+            """Update lat/lon in the first config entry's options."""
             new_lat = call.data[CONF_LATITUDE]
             new_lon = call.data[CONF_LONGITUDE]
             entries = hass.config_entries.async_entries(DOMAIN)
@@ -206,19 +251,152 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             schema=SERVICE_UPDATE_LOCATION_SCHEMA,
         )
 
+    setup_seconds = time.monotonic() - setup_start
+    hass.data[DOMAIN][entry.entry_id]["setup_seconds"] = setup_seconds
+    LOGGER.debug("Setup of %s took %.3f s", entry.title, setup_seconds)
+
     return True
 
 
+async def _async_retarget(
+    hass: HomeAssistant, entry: ConfigEntry, latitude: float, longitude: float
+) -> None:
+    """Point an entry's forecast at a new location and refetch it in place."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    LOGGER.debug("Retargeting %s to %s,%s", entry.title, latitude, longitude)
+    warmer: FavoriteWarmer | None = entry_data.get("favorites")
+    if await entry_data["fetcher"].async_set_location(
+        latitude, longitude, warmer.get(latitude, longitude) if warmer else None
+    ):
+        LOGGER.debug("Serving the prewarmed forecast until the refresh completes")
+    entry.async_create_background_task(
+        hass,
+        _async_resolve_location_name(hass, entry, latitude, longitude),
+        f"{DOMAIN} reverse geocode",
+    )
+    # One combined upstream call refreshes both coordinators
+    await asyncio.gather(
+        entry_data["minutely"].async_refresh(), entry_data["hourly"].async_refresh()
+    )
+
+
+@callback
+def _async_follow(
+    hass: HomeAssistant, entry: ConfigEntry, entity_id: str | None
+) -> None:
+    """Follow a tracker entity with the forecast location, or stop following."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    if (follower := entry_data.pop("follower", None)) is not None:
+        follower.async_stop()
+    if not entity_id:
+        return
+
+    @callback
+    def retarget(latitude: float, longitude: float) -> None:
+        entry.async_create_background_task(
+            hass,
+            _async_retarget(hass, entry, latitude, longitude),
+            f"{DOMAIN} follow {entity_id}",
+        )
+
+    @callback
+    def restore() -> None:
+        settings = entry_data["settings"]
+        fetcher: ForecastFetcher = entry_data["fetcher"]
+        location = settings[CONF_LATITUDE], settings[CONF_LONGITUDE]
+        if (fetcher.latitude, fetcher.longitude) != location:
+            retarget(*location)
+
+    follower = LocationFollower(
+        hass, entity_id, entry_data["fetcher"], retarget, restore
+    )
+    follower.async_start()
+    entry_data["follower"] = follower
+
+
+@callback
+def _async_prewarm(
+    hass: HomeAssistant, entry: ConfigEntry, favorites: list[str]
+) -> None:
+    """Keep favorite locations warm, or stop when there are none."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    if (warmer := entry_data.pop("favorites", None)) is not None:
+        warmer.async_stop()
+    if not favorites:
+        return
+
+    warmer = FavoriteWarmer(
+        hass,
+        entry.entry_id,
+        entry_data["fetcher"],
+        [parse_coordinates(favorite) for favorite in favorites],
+    )
+    warmer.async_start()
+    entry_data["favorites"] = warmer
+    entry.async_create_background_task(
+        hass, warmer.async_refresh(), f"{DOMAIN} prewarm favorites"
+    )
+
+
 async def _async_options_updated(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> None:
-    """Handle options update — reload the entry to apply new intervals."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Apply option changes in place; reload only for structural changes."""
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    new = _entry_settings(entry)
+    if entry_data is None or new[CONF_API_KEY] != entry_data["settings"][CONF_API_KEY]:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    old = entry_data["settings"]
+    if new == old:
+        return
+    entry_data["settings"] = new
+
+    minutely_coord: MinutelyCoordinator = entry_data["minutely"]
+    hourly_coord: HourlyCoordinator = entry_data["hourly"]
+    # New intervals apply from the next scheduled refresh
+    entry_data["fetcher"].quota.set_demand(
+        entry.entry_id, new[CONF_MINUTELY_INTERVAL]
+    )
+    minutely_coord.configure_polling(
+        new[CONF_MINUTELY_INTERVAL], _adaptive_polling(new)
+    )
+    hourly_coord.configure_polling(new[CONF_HOURLY_INTERVAL])
+    if new[CONF_FOLLOW_ENTITY] != old[CONF_FOLLOW_ENTITY]:
+        _async_follow(hass, entry, new[CONF_FOLLOW_ENTITY])
+    if new[CONF_FAVORITES] != old[CONF_FAVORITES]:
+        _async_prewarm(hass, entry, new[CONF_FAVORITES])
+    if new[CONF_UNIT_SYSTEM] != old[CONF_UNIT_SYSTEM]:
+        # Values are converted locally; republish them without refetching
+        hourly_coord.async_update_listeners()
+
+    latitude, longitude = new[CONF_LATITUDE], new[CONF_LONGITUDE]
+    fetcher: ForecastFetcher = entry_data["fetcher"]
+    moved = (latitude, longitude) != (old[CONF_LATITUDE], old[CONF_LONGITUDE])
+    # Without a tracker to follow, return from the last followed cell
+    unfollowed = bool(old[CONF_FOLLOW_ENTITY]) and not new[CONF_FOLLOW_ENTITY]
+    if moved or (
+        unfollowed and (fetcher.latitude, fetcher.longitude) != (latitude, longitude)
+    ):
+        await _async_retarget(hass, entry, latitude, longitude)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the saved forecast when a config entry is deleted."""
+    await Store(
+        hass, STORAGE_VERSION_FORECAST, f"{STORAGE_KEY_FORECAST}.{entry.entry_id}"
+    ).async_remove()
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        if (follower := entry_data.get("follower")) is not None:
+            follower.async_stop()
+        if (warmer := entry_data.get("favorites")) is not None:
+            warmer.async_stop()
+        async_dispatcher_send(hass, SIGNAL_ENTRY_UNLOADED.format(entry.entry_id))
     return unload_ok
@@ -0,0 +1,215 @@
+"""Resilient HTTP access to PirateWeather."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_TIMEOUT,
+    DOMAIN,
+    LOGGER,
+    RETRY_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+)
+
+DATA_CIRCUIT_BREAKERS = f"{DOMAIN}_circuit_breakers"
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# Admission of a request while the circuit is closed; trial requests get a
+# token of their own
+ADMITTED = object()
+
+
+class CircuitOpenError(HomeAssistantError):
+    """Raised when requests to a host are suspended by its circuit breaker."""
+
+
+@dataclass(slots=True)
+class Response:
+    """A completed HTTP response with its body read."""
+
+    status: int
+    headers: Mapping[str, str]
+    body: bytes
+    attempts: int
+
+
+def get_circuit_breaker(hass: HomeAssistant, url: str) -> CircuitBreaker:
+    """Return the process-wide circuit breaker for a URL's host."""
+    breakers: dict[str, CircuitBreaker] = hass.data.setdefault(
+        DATA_CIRCUIT_BREAKERS, {}
+    )
+    host = urlsplit(url).hostname or ""
+    if (breaker := breakers.get(host)) is None:
+        breaker = breakers[host] = CircuitBreaker(host)
+    return breaker
+
+
+def _is_server_error(status: int) -> bool:
+    """Return True for responses that indicate an upstream outage."""
+    return status >= 500
+
+
+class CircuitBreaker:
+    """Circuit breaker shared by every request to one host.
+
+    After CIRCUIT_FAILURE_THRESHOLD consecutive failed requests (each after
+    its retries) the circuit opens and requests are rejected without a
+    network call. Once CIRCUIT_RESET_TIMEOUT has passed a single trial
+    request is allowed; its outcome closes the circuit or opens it again.
+    """
+
+    def __init__(self, host: str) -> None:
+        self.host = host
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial: object | None = None
+        self.stats: dict[str, int] = {
+            "requests": 0,
+            "retries": 0,
+            "failures": 0,
+            "rejected": 0,
+            "opened": 0,
+        }
+
+    def allow(self) -> object | None:
+        """Admit a request; return its admission token, or None to reject it.
+
+        The token is ADMITTED while the circuit is closed and a token owned
+        by the trial request while it is half open.
+        """
+        if self.state == STATE_OPEN:
+            if time.monotonic() - (self.opened_at or 0) < CIRCUIT_RESET_TIMEOUT:
+                return None
+            self.state = STATE_HALF_OPEN
+            self._trial = None
+        if self.state == STATE_HALF_OPEN:
+            if self._trial is not None:
+                return None
+            self._trial = object()
+            return self._trial
+        return ADMITTED
+
+    def record_success(self) -> None:
+        """Close the circuit after a request reached a healthy host."""
+        if self.state != STATE_CLOSED:
+            LOGGER.info("%s is reachable again; resuming requests", self.host)
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._trial = None
+
+    def abandon(self, admission: object) -> None:
+        """Release the trial slot if its request was cancelled before completing."""
+        if admission is self._trial:
+            self._trial = None
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit when needed."""
+        self.failures += 1
+        self.stats["failures"] += 1
+        if self.state == STATE_HALF_OPEN or (
+            self.state == STATE_CLOSED and self.failures >= CIRCUIT_FAILURE_THRESHOLD
+        ):
+            if self.state == STATE_CLOSED:
+                LOGGER.warning(
+                    "%s failed %d times in a row; pausing requests for %d s",
+                    self.host,
+                    self.failures,
+                    CIRCUIT_RESET_TIMEOUT,
+                )
+            self.state = STATE_OPEN
+            self.opened_at = time.monotonic()
+            self._trial = None
+            self.stats["opened"] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "host": self.host,
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            **self.stats,
+        }
+
+
+def _backoff(attempt: int) -> float:
+    """Return the jittered delay before retry number `attempt` (from 1)."""
+    ceiling = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+    return random.uniform(0, ceiling)
+
+
+async def async_request(
+    hass: HomeAssistant,
+    url: str,
+    *,
+    timeout: float,
+    attempts: int = RETRY_ATTEMPTS,
+    headers: Mapping[str, str] | None = None,
+    on_response: Callable[[int, Mapping[str, str]], None] | None = None,
+) -> Response:
+    """GET a URL with retries and the host's circuit breaker.
+
+    Timeouts, connection errors and 5xx responses are retried up to
+    `attempts` times in total with jittered exponential backoff; the
+    breaker counts one failure once they are used up, and a trial request
+    is not retried. Other
+    responses are returned as-is. `headers` are sent with every attempt,
+    e.g. conditional request validators. `on_response` is called with the status
+    and headers of every response received, including retried ones.
+    Raises CircuitOpenError while the host's circuit is open, or the last
+    transport error once the attempts are used up.
+    """
+    breaker = get_circuit_breaker(hass, url)
+    session = async_get_clientsession(hass)
+    attempt = 0
+    while True:
+        attempt += 1
+        if (admission := breaker.allow()) is None:
+            breaker.stats["rejected"] += 1
+            raise CircuitOpenError(f"Requests to {breaker.host} are paused")
+        last_attempt = attempt >= attempts or admission is not ADMITTED
+        breaker.stats["requests"] += 1
+        try:
+            async with session.get(url, headers=headers, timeout=timeout) as resp:
+                if on_response is not None:
+                    on_response(resp.status, resp.headers)
+                response = Response(
+                    resp.status, resp.headers, await resp.read(), attempt
+                )
+        except asyncio.CancelledError:
+            breaker.abandon(admission)
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            if last_attempt:
+                breaker.record_failure()
+                raise
+            LOGGER.debug("Request to %s failed (%s); retrying", breaker.host, err)
+        else:
+            if not _is_server_error(response.status):
+                breaker.record_success()
+                return response
+            if last_attempt:
+                breaker.record_failure()
+                return response
+            LOGGER.debug("%s returned %d; retrying", breaker.host, response.status)
+        breaker.stats["retries"] += 1
+        await asyncio.sleep(_backoff(attempt))
@@ -0,0 +1,156 @@
+"""Serve the bundled card JS and register it as a Lovelace resource."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+from collections.abc import Callable
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    CARD_CACHE_CONTROL,
+    CARD_URL_BASE,
+    LOGGER,
+    STORAGE_KEY_CARD,
+    STORAGE_VERSION,
+)
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional, gzip is always built
+    brotli = None
+
+CARD_NAME = "precipitation-radial-card"
+CARD_PATH = Path(__file__).parent / "www" / f"{CARD_NAME}.js"
+
+
+def _gzip(data: bytes) -> bytes:
+    """Return reproducible maximum-compression gzip bytes."""
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _variants() -> list[tuple[Path, Callable[[bytes], bytes]]]:
+    """Return the precompressed siblings to build and their compressors."""
+    variants = [(CARD_PATH.with_name(f"{CARD_PATH.name}.gz"), _gzip)]
+    if brotli is not None:
+        variants.append(
+            (CARD_PATH.with_name(f"{CARD_PATH.name}.br"), brotli.compress)
+        )
+    return variants
+
+
+def _prepare_card(stored: dict[str, Any] | None, legacy_dir: Path) -> dict[str, Any]:
+    """Return the card's content hash, building compressed variants when stale.
+
+    The hash is reused from `stored` while the file's size and modification
+    time are unchanged, so the card is only read and compressed after an
+    update.
+    """
+    stat = CARD_PATH.stat()
+    variants = _variants()
+    if (
+        stored
+        and stored.get("size") == stat.st_size
+        and stored.get("mtime") == stat.st_mtime
+        and all(path.exists() for path, _ in variants)
+    ):
+        return stored
+
+    data = CARD_PATH.read_bytes()
+    for path, compress in variants:
+        try:
+            path.write_bytes(compress(data))
+        except OSError as err:
+            # Served uncompressed if the integration directory is read-only
+            LOGGER.debug("Could not write %s: %s", path.name, err)
+
+    if stored is None:
+        # Copies made by earlier versions in the user's www directory
+        for legacy in legacy_dir.glob(f"{CARD_NAME}*.js"):
+            legacy.unlink(missing_ok=True)
+
+    return {
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+        "hash": hashlib.sha256(data).hexdigest()[:12],
+    }
+
+
+class CardView(HomeAssistantView):
+    """Serve the card under its content-hashed file name."""
+
+    requires_auth = False
+    url = f"{CARD_URL_BASE}/{{filename}}"
+    name = "api:precipitation_radial:card"
+
+    def __init__(self, filename: str) -> None:
+        self._filename = filename
+
+    async def get(self, request: web.Request, filename: str) -> web.StreamResponse:
+        """Return the card, precompressed when the client accepts it."""
+        if filename != self._filename:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        return web.FileResponse(
+            CARD_PATH,
+            headers={
+                hdrs.CACHE_CONTROL: CARD_CACHE_CONTROL,
+                hdrs.VARY: hdrs.ACCEPT_ENCODING,
+            },
+        )
+
+
+async def async_register_card(hass: HomeAssistant) -> None:
+    """Serve the card JS and point the Lovelace resource at its current URL."""
+    store: Store = Store(hass, STORAGE_VERSION, STORAGE_KEY_CARD)
+    stored = await store.async_load()
+    info = await hass.async_add_executor_job(
+        _prepare_card,
+        stored,
+        Path(hass.config.path("www", "community", CARD_NAME)),
+    )
+    if info != stored:
+        await store.async_save(info)
+
+    filename = f"{CARD_NAME}-{info['hash']}.js"
+    hass.http.register_view(CardView(filename))
+    await _async_register_resource(hass, f"{CARD_URL_BASE}/{filename}")
+
+
+async def _async_register_resource(hass: HomeAssistant, url: str) -> None:
+    """Add or update the card's Lovelace resource."""
+    from homeassistant.components.lovelace.resources import ResourceStorageCollection
+
+    lovelace = hass.data.get("lovelace")
+    if lovelace is None:
+        return
+    resources: ResourceStorageCollection = (
+        lovelace.resources if hasattr(lovelace, "resources") else lovelace["resources"]
+    )
+    await resources.async_get_info()
+
+    for item in resources.async_items():
+        if CARD_NAME not in item.get("url", ""):
+            continue
+        if item["url"] != url:
+            if isinstance(resources, ResourceStorageCollection):
+                await resources.async_update_item(
+                    item["id"], {"res_type": "module", "url": url}
+                )
+            else:
+                item["url"] = url
+        return
+
+    if isinstance(resources, ResourceStorageCollection):
+        await resources.async_create_item({"res_type": "module", "url": url})
+    else:
+        from homeassistant.components.frontend import add_extra_js_url
+
+        add_extra_js_url(hass, url)
@@ -7,19 +7,48 @@ import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.selector import (
+    EntitySelector,
+    EntitySelectorConfig,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+    TextSelector,
+    TextSelectorConfig,
+)
 
+from .api import async_request
 from .const import (
     API_ENDPOINT,
+    API_UNITS,
+    CONF_ADAPTIVE_POLLING,
     CONF_API_KEY,
+    CONF_DAILY_CALL_BUDGET,
+    CONF_FAVORITES,
+    CONF_FOLLOW_ENTITY,
     CONF_HOURLY_INTERVAL,
     CONF_LATITUDE,
     CONF_LONGITUDE,
     CONF_MINUTELY_INTERVAL,
+    CONF_MINUTELY_MAX_INTERVAL,
+    CONF_MINUTELY_MIN_INTERVAL,
+    CONF_UNIT_SYSTEM,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_DAILY_CALL_BUDGET,
     DEFAULT_HOURLY_INTERVAL,
     DEFAULT_MINUTELY_INTERVAL,
+    DEFAULT_MINUTELY_MAX_INTERVAL,
+    DEFAULT_MINUTELY_MIN_INTERVAL,
+    DEFAULT_UNIT_SYSTEM,
     DOMAIN,
+    UNIT_SYSTEM_AUTO,
+    UNIT_SYSTEM_METRIC,
+    UNIT_SYSTEM_US,
 )
+from .util import parse_coordinates
+
+# Keep the form responsive: one retry at most while validating a key
+VALIDATION_ATTEMPTS = 2
 
 
 class PrecipitationRadialConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -44,19 +73,21 @@ class PrecipitationRadialConfigFlow(ConfigFlow, domain=DOMAIN):
             self._abort_if_unique_id_configured()
 
             # Validate the API key with a lightweight test call
-            session = async_get_clientsession(self.hass)
+            url = (
+                f"{API_ENDPOINT}/{api_key}/{latitude},{longitude}"
+                f"?exclude=minutely,hourly,daily,alerts,flags&units={API_UNITS}"
+            )
             try:
-                url = (
-                    f"{API_ENDPOINT}/{api_key}/{latitude},{longitude}"
-                    f"?exclude=minutely,hourly,daily,alerts,flags&units=si"
+                response = await async_request(
+                    self.hass, url, timeout=15, attempts=VALIDATION_ATTEMPTS
                 )
-                async with session.get(url, timeout=15) as resp:
-                    if resp.status == 403:
-                        errors["base"] = "invalid_api_key"
-                    elif resp.status != 200:
-                        errors["base"] = "cannot_connect"
             except Exception:
                 errors["base"] = "cannot_connect"
+            else:
+                if response.status == 403:
+                    errors["base"] = "invalid_api_key"
+                elif response.status != 200:
+                    errors["base"] = "cannot_connect"
 
             if not errors:
                 return self.async_create_entry(
@@ -97,8 +128,18 @@ class PrecipitationRadialOptionsFlow(OptionsFlow):
     async def async_step_init(
         self, user_input: dict | None = None
     ) -> FlowResult:
+        errors = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            try:
+                user_input[CONF_FAVORITES] = [
+                    "{}, {}".format(*parse_coordinates(favorite))
+                    for favorite in user_input.get(CONF_FAVORITES, [])
+                    if favorite.strip()
+                ]
+            except ValueError:
+                errors[CONF_FAVORITES] = "invalid_favorite"
+            else:
+                return self.async_create_entry(title="", data=user_input)
 
         current_lat = self._config_entry.options.get(
             CONF_LATITUDE, self._config_entry.data.get(CONF_LATITUDE)
@@ -131,6 +172,61 @@ class PrecipitationRadialOptionsFlow(OptionsFlow):
                             CONF_HOURLY_INTERVAL, DEFAULT_HOURLY_INTERVAL
                         ),
                     ): vol.All(vol.Coerce(int), vol.Range(min=300, max=7200)),
+                    vol.Required(
+                        CONF_ADAPTIVE_POLLING,
+                        default=self._config_entry.options.get(
+                            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+                        ),
+                    ): bool,
+                    vol.Required(
+                        CONF_MINUTELY_MIN_INTERVAL,
+                        default=self._config_entry.options.get(
+                            CONF_MINUTELY_MIN_INTERVAL, DEFAULT_MINUTELY_MIN_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=60, max=3600)),
+                    vol.Required(
+                        CONF_MINUTELY_MAX_INTERVAL,
+                        default=self._config_entry.options.get(
+                            CONF_MINUTELY_MAX_INTERVAL, DEFAULT_MINUTELY_MAX_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=300, max=7200)),
+                    vol.Required(
+                        CONF_DAILY_CALL_BUDGET,
+                        default=self._config_entry.options.get(
+                            CONF_DAILY_CALL_BUDGET, DEFAULT_DAILY_CALL_BUDGET
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=24, max=10000)),
+                    vol.Optional(
+                        CONF_FOLLOW_ENTITY,
+                        description={
+                            "suggested_value": self._config_entry.options.get(
+                                CONF_FOLLOW_ENTITY
+                            )
+                        },
+                    ): EntitySelector(
+                        EntitySelectorConfig(domain=["device_tracker", "person"])
+                    ),
+                    vol.Optional(
+                        CONF_FAVORITES,
+                        default=self._config_entry.options.get(CONF_FAVORITES, []),
+                    ): TextSelector(TextSelectorConfig(multiple=True)),
+                    vol.Required(
+                        CONF_UNIT_SYSTEM,
+                        default=self._config_entry.options.get(
+                            CONF_UNIT_SYSTEM, DEFAULT_UNIT_SYSTEM
+                        ),
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=[
+                                UNIT_SYSTEM_AUTO,
+                                UNIT_SYSTEM_METRIC,
+                                UNIT_SYSTEM_US,
+                            ],
+                            mode=SelectSelectorMode.DROPDOWN,
+                            translation_key=CONF_UNIT_SYSTEM,
+                        )
+                    ),
                 }
             ),
+            errors=errors,
         )
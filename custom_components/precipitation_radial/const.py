@@ -6,12 +6,120 @@ DOMAIN = "precipitation_radial"
 LOGGER = logging.getLogger(__package__)
 
 API_ENDPOINT = "https://api.pirateweather.net/forecast"
+# Unit system every forecast is fetched in. Values are converted locally per
+# entry, so entries at one location share upstream data whatever their units.
+API_UNITS = "us"
 
 CONF_API_KEY = "api_key"
 CONF_LATITUDE = "latitude"
 CONF_LONGITUDE = "longitude"
 CONF_MINUTELY_INTERVAL = "minutely_interval"
 CONF_HOURLY_INTERVAL = "hourly_interval"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_MINUTELY_MIN_INTERVAL = "minutely_min_interval"
+CONF_MINUTELY_MAX_INTERVAL = "minutely_max_interval"
+CONF_DAILY_CALL_BUDGET = "daily_call_budget"
+CONF_FOLLOW_ENTITY = "follow_entity"
+CONF_FAVORITES = "favorite_locations"
+CONF_UNIT_SYSTEM = "unit_system"
+
+UNIT_SYSTEM_AUTO = "auto"
+UNIT_SYSTEM_METRIC = "metric"
+UNIT_SYSTEM_US = "us"
 
 DEFAULT_MINUTELY_INTERVAL = 600
 DEFAULT_HOURLY_INTERVAL = 1800
+DEFAULT_ADAPTIVE_POLLING = False
+DEFAULT_MINUTELY_MIN_INTERVAL = 120
+DEFAULT_MINUTELY_MAX_INTERVAL = 1800
+DEFAULT_DAILY_CALL_BUDGET = 300
+DEFAULT_UNIT_SYSTEM = UNIT_SYSTEM_AUTO
+
+# Thresholds for a minute to count as precipitating (matches the card)
+PRECIP_INTENSITY_THRESHOLD = 0.005
+PRECIP_PROBABILITY_THRESHOLD = 0.10
+# Adaptive polling backs off when every minute is below this probability
+ADAPTIVE_DRY_PROBABILITY = 0.05
+
+# Seconds during which a just-fetched forecast block is reused instead of refetched
+FETCH_REUSE_WINDOW = 60
+
+STORAGE_VERSION = 1
+STORAGE_VERSION_FORECAST = 2
+STORAGE_KEY_FORECAST = f"{DOMAIN}.forecast"
+# Delay (seconds) used to coalesce forecast writes to disk
+STORAGE_SAVE_DELAY = 10
+
+# Maximum age (seconds) of a saved forecast block that may seed a coordinator
+RESTORE_MINUTELY_MAX_AGE = 1800
+RESTORE_HOURLY_MAX_AGE = 7200
+
+# Dispatcher signal sent when an entry's reverse-geocoded place name resolves
+SIGNAL_LOCATION_NAME = f"{DOMAIN}_location_name_{{}}"
+# Dispatcher signal sent when an entry is unloaded, ending its subscriptions
+SIGNAL_ENTRY_UNLOADED = f"{DOMAIN}_entry_unloaded_{{}}"
+
+# Coordinate quantization step (degrees) approximating PirateWeather's ~13 km grid
+GRID_DEGREES = 0.1
+
+# A followed tracker must move this fraction of a grid cell past the current
+# cell's edge, then stay in its new cell for FOLLOW_MIN_DWELL seconds, before
+# the forecast is retargeted
+FOLLOW_HYSTERESIS = 0.25
+FOLLOW_MIN_DWELL = 300
+# Tracker fixes less accurate than this (meters) are ignored
+FOLLOW_MAX_GPS_ACCURACY = 1000
+
+# Seconds between prewarm rounds over the favorite locations (stretched when
+# the API quota is tight), and how often to check whether a round is due. A
+# round starts up to one check late, so rounds stay within the age at which
+# warm minutely data is still used
+FAVORITE_CHECK_INTERVAL = 300
+FAVORITE_REFRESH_INTERVAL = RESTORE_MINUTELY_MAX_AGE - FAVORITE_CHECK_INTERVAL
+
+STORAGE_KEY_GEOCODE = f"{DOMAIN}.geocode"
+GEOCODE_CACHE_SIZE = 256
+GEOCODE_CACHE_TTL = 30 * 86400
+# Nominatim usage policy allows at most one request per second
+GEOCODE_MIN_REQUEST_SPACING = 1.0
+
+STORAGE_KEY_QUOTA = f"{DOMAIN}.quota"
+# Monthly call cap assumed when the API does not report one (free tier)
+DEFAULT_MONTHLY_CALL_LIMIT = 10000
+
+# Seconds a grid-cell forecast is shared with other entries in the same cell
+FORECAST_CACHE_MAX_AGE = 120
+
+# Attempts per PirateWeather request, and the jittered backoff between them
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 8.0
+# Consecutive failed requests that open a host's circuit breaker, and the
+# seconds it stays open before a single trial request is let through
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 120
+
+# PirateWeather's minutely forecast follows 15-minute model steps; new data is
+# usually served within a couple of minutes of each step
+MINUTELY_MODEL_CADENCE = 900
+MINUTELY_MODEL_LAG = 120
+# Seconds after the lag over which aligned minutely polls are staggered
+SCHEDULER_ALIGN_SPREAD = 120
+# Overdue polls (e.g. after restoring a saved forecast) are spread over this
+# many seconds instead of all firing at once
+SCHEDULER_CATCHUP_WINDOW = 60
+SCHEDULER_MIN_DELAY = 5
+
+# Seconds a forecast fetched for get_forecast (or by prewarming) is reused,
+# longer when only hourly and daily blocks are asked for, and how many are kept
+GET_FORECAST_CACHE_TTL = 300
+GET_FORECAST_CACHE_HOURLY_TTL = 1800
+GET_FORECAST_CACHE_SIZE = 32
+
+# Recent samples kept per timed operation for the performance metrics
+METRICS_SAMPLES = 200
+
+STORAGE_KEY_CARD = f"{DOMAIN}.card"
+# The card is served under a content-hashed URL, so it may be cached forever
+CARD_URL_BASE = f"/{DOMAIN}/card"
+CARD_CACHE_CONTROL = "public, max-age=31536000, immutable"
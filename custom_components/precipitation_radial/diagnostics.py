@@ -0,0 +1,53 @@
+"""Diagnostics support for Precipitation Radial Card."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .api import get_circuit_breaker
+from .const import (
+    API_ENDPOINT,
+    CONF_API_KEY,
+    CONF_FAVORITES,
+    CONF_LATITUDE,
+    CONF_LONGITUDE,
+    DOMAIN,
+)
+from .coordinator import DATA_FORECAST_CACHE
+from .geocode import DATA_GEOCODER
+from .services import DATA_SERVICE_CACHE
+
+TO_REDACT = {CONF_API_KEY, CONF_LATITUDE, CONF_LONGITUDE, CONF_FAVORITES}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    fetcher = entry_data["fetcher"]
+    geocoder = hass.data.get(DATA_GEOCODER)
+    forecast_cache = hass.data.get(DATA_FORECAST_CACHE)
+    service_cache = hass.data.get(DATA_SERVICE_CACHE)
+    follower = entry_data.get("follower")
+    warmer = entry_data.get("favorites")
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "setup_seconds": entry_data.get("setup_seconds"),
+        "fetch": dict(fetcher.stats),
+        "metrics": fetcher.metrics.as_dict(),
+        "circuit_breaker": get_circuit_breaker(hass, API_ENDPOINT).as_dict(),
+        "forecast_cache": dict(forecast_cache.stats) if forecast_cache else None,
+        "geocode": dict(geocoder.stats) if geocoder else None,
+        "service_cache": dict(service_cache.stats) if service_cache else None,
+        "follow": follower.as_dict() if follower else None,
+        "favorites": warmer.as_dict() if warmer else None,
+    }
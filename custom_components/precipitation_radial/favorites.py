@@ -0,0 +1,125 @@
+"""Keep forecasts for an entry's favorite locations warm."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import FAVORITE_CHECK_INTERVAL, FAVORITE_REFRESH_INTERVAL, LOGGER
+from .coordinator import ForecastFetcher, WarmForecast
+from .geocode import async_get_geocoder
+from .services import get_service_cache
+from .util import grid_key
+
+
+class FavoriteWarmer:
+    """Prefetch the forecast and place name of each favorite location.
+
+    Every FAVORITE_REFRESH_INTERVAL, stretched like the poll intervals when
+    the API quota is tight, each favorite outside the entry's current grid
+    cell is fetched in one combined call and its name is resolved into the
+    geocode cache. The fetch goes through the shared grid-cell cache and the
+    decoded response is kept for get_forecast, so other entries and service
+    calls for that cell can use it. Moving the entry to a favorite is then
+    served from the warm forecast while the live refresh runs.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        fetcher: ForecastFetcher,
+        favorites: list[tuple[float, float]],
+    ) -> None:
+        self.hass = hass
+        self._consumer = f"{entry_id}_favorites"
+        self._fetcher = fetcher
+        self._favorites = favorites
+        self._warm: dict[str, WarmForecast] = {}
+        self._last_round: float | None = None
+        self._running = False
+        self._unsub: CALLBACK_TYPE | None = None
+        self.stats: dict[str, int] = {"rounds": 0, "failures": 0}
+
+    @callback
+    def async_start(self) -> None:
+        """Start prewarming."""
+        self._fetcher.quota.set_demand(
+            self._consumer, FAVORITE_REFRESH_INTERVAL / len(self._favorites)
+        )
+        self._unsub = async_track_time_interval(
+            self.hass,
+            self.async_refresh,
+            timedelta(seconds=FAVORITE_CHECK_INTERVAL),
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop prewarming."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        self._fetcher.quota.remove_demand(self._consumer)
+
+    async def async_refresh(self, now: datetime | None = None) -> None:
+        """Run a prewarm round if one is due."""
+        interval = self._fetcher.quota.adjust(FAVORITE_REFRESH_INTERVAL)
+        if self._running or (
+            self._last_round is not None
+            and time.monotonic() - self._last_round < interval
+        ):
+            return
+        self._running = True
+        self._last_round = time.monotonic()
+        self.stats["rounds"] += 1
+        try:
+            geocoder = await async_get_geocoder(self.hass)
+            service_cache = get_service_cache(self.hass)
+            for latitude, longitude in self._favorites:
+                cell = grid_key(latitude, longitude)
+                current = grid_key(self._fetcher.latitude, self._fetcher.longitude)
+                if cell == current:
+                    # The live forecast already covers it
+                    self._warm.pop(cell, None)
+                    continue
+                try:
+                    parts = await self._fetcher.async_fetch_location(
+                        latitude,
+                        longitude,
+                        partial(
+                            service_cache.put,
+                            self._fetcher.share_key(latitude, longitude),
+                            False,
+                        ),
+                    )
+                except HomeAssistantError as err:
+                    self.stats["failures"] += 1
+                    LOGGER.debug(
+                        "Could not prewarm %s,%s: %s", latitude, longitude, err
+                    )
+                    continue
+                self._warm[cell] = WarmForecast(time.time(), parts)
+                await geocoder.async_reverse_geocode(latitude, longitude)
+        finally:
+            self._running = False
+
+    def get(self, latitude: float, longitude: float) -> WarmForecast | None:
+        """Return the warm forecast for the grid cell of a location, if any."""
+        return self._warm.get(grid_key(latitude, longitude))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the prewarm state for diagnostics."""
+        now = time.time()
+        return {
+            "favorites": len(self._favorites),
+            "warm_ages": sorted(
+                round(now - warm.fetched_at) for warm in self._warm.values()
+            ),
+            **self.stats,
+        }
@@ -0,0 +1,166 @@
+"""Follow a device tracker or person with the forecast location."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from homeassistant.const import ATTR_GPS_ACCURACY, ATTR_LATITUDE, ATTR_LONGITUDE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+
+from .const import (
+    FOLLOW_HYSTERESIS,
+    FOLLOW_MAX_GPS_ACCURACY,
+    FOLLOW_MIN_DWELL,
+    GRID_DEGREES,
+    LOGGER,
+)
+from .coordinator import ForecastFetcher
+from .util import grid_cell, grid_center
+
+
+def tracked_position(state: State | None) -> tuple[float, float] | None:
+    """Return the position reported by a tracker state, if usable."""
+    if state is None:
+        return None
+    attributes = state.attributes
+    latitude = attributes.get(ATTR_LATITUDE)
+    longitude = attributes.get(ATTR_LONGITUDE)
+    if latitude is None or longitude is None:
+        return None
+    if (attributes.get(ATTR_GPS_ACCURACY) or 0) > FOLLOW_MAX_GPS_ACCURACY:
+        return None
+    return float(latitude), float(longitude)
+
+
+class LocationFollower:
+    """Retarget an entry's forecast when a tracked entity changes grid cell.
+
+    The tracker has to move FOLLOW_HYSTERESIS of a cell past the edge of the
+    cell around the current forecast location, then stay in its new cell for
+    FOLLOW_MIN_DWELL seconds. Jitter near a cell boundary and driving through
+    cells therefore cost no API calls. New locations are snapped to the
+    center of their cell. If the tracker is removed and has not come back
+    after FOLLOW_MIN_DWELL seconds, the entry returns to its configured
+    location through `restore`.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entity_id: str,
+        fetcher: ForecastFetcher,
+        retarget: Callable[[float, float], None],
+        restore: Callable[[], None],
+    ) -> None:
+        self.hass = hass
+        self.entity_id = entity_id
+        self._fetcher = fetcher
+        self._retarget = retarget
+        self._restore = restore
+        self._candidate: tuple[int, int] | None = None
+        self._unsub_state: CALLBACK_TYPE | None = None
+        self._unsub_dwell: CALLBACK_TYPE | None = None
+        self.stats: dict[str, int] = {
+            "updates": 0,
+            "debounced": 0,
+            "retargets": 0,
+            "restores": 0,
+        }
+
+    @callback
+    def async_start(self) -> None:
+        """Start following the tracker."""
+        self._unsub_state = async_track_state_change_event(
+            self.hass, [self.entity_id], self._handle_state_change
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following the tracker."""
+        if self._unsub_state is not None:
+            self._unsub_state()
+            self._unsub_state = None
+        self._cancel_dwell()
+
+    @callback
+    def _cancel_dwell(self) -> None:
+        """Drop the pending move, if any."""
+        self._candidate = None
+        if self._unsub_dwell is not None:
+            self._unsub_dwell()
+            self._unsub_dwell = None
+
+    def _left_cell(self, latitude: float, longitude: float) -> bool:
+        """Return True if a position is clearly outside the current cell."""
+        limit = GRID_DEGREES * (0.5 + FOLLOW_HYSTERESIS)
+        return (
+            abs(latitude - self._fetcher.latitude) > limit
+            or abs(longitude - self._fetcher.longitude) > limit
+        )
+
+    @callback
+    def _handle_state_change(self, event: Event) -> None:
+        if event.data["new_state"] is None:
+            self._cancel_dwell()
+            self._unsub_dwell = async_call_later(
+                self.hass, FOLLOW_MIN_DWELL, self._handle_removed
+            )
+            return
+        position = tracked_position(event.data["new_state"])
+        if position is None:
+            return
+        self.stats["updates"] += 1
+        if not self._left_cell(*position):
+            if self._candidate is not None:
+                self.stats["debounced"] += 1
+            self._cancel_dwell()
+            return
+
+        cell = grid_cell(*position)
+        if cell == self._candidate:
+            return
+        if self._candidate is not None:
+            self.stats["debounced"] += 1
+        self._cancel_dwell()
+        self._candidate = cell
+        self._unsub_dwell = async_call_later(
+            self.hass, FOLLOW_MIN_DWELL, self._handle_dwell
+        )
+
+    @callback
+    def _handle_dwell(self, now: datetime) -> None:
+        """Retarget once the tracker has stayed in its new cell."""
+        self._unsub_dwell = None
+        candidate, self._candidate = self._candidate, None
+        position = tracked_position(self.hass.states.get(self.entity_id))
+        if position is None or grid_cell(*position) != candidate:
+            return
+        self.stats["retargets"] += 1
+        latitude, longitude = grid_center(*position)
+        LOGGER.debug(
+            "%s moved to the cell at %s,%s", self.entity_id, latitude, longitude
+        )
+        self._retarget(latitude, longitude)
+
+    @callback
+    def _handle_removed(self, now: datetime) -> None:
+        """Return to the configured location once the tracker stays removed."""
+        self._unsub_dwell = None
+        if self.hass.states.get(self.entity_id) is not None:
+            return
+        self.stats["restores"] += 1
+        LOGGER.debug(
+            "%s was removed; returning to the configured location", self.entity_id
+        )
+        self._restore()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the follower state for diagnostics."""
+        return {
+            "entity_id": self.entity_id,
+            "pending_move": self._candidate is not None,
+            **self.stats,
+        }
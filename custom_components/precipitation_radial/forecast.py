@@ -0,0 +1,374 @@
+"""Compact in-memory forecast data and its columnar views for the card."""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from typing import Any
+
+from .const import (
+    ADAPTIVE_DRY_PROBABILITY,
+    PRECIP_INTENSITY_THRESHOLD,
+    PRECIP_PROBABILITY_THRESHOLD,
+)
+
+# Precipitation types sent to the card as integer codes (index in this tuple)
+PRECIP_TYPES = ("none", "rain", "snow", "sleet", "hail", "ice")
+_PRECIP_TYPE_CODES = {name: code for code, name in enumerate(PRECIP_TYPES)}
+
+HOURLY_HOURS = 24
+
+# Upper intensity bounds (in/hr) of the card's color buckets 1-6; bucket 7 is
+# anything heavier and bucket 0 is no precipitation
+COLOR_BUCKET_LIMITS = (0.01, 0.05, 0.15, 0.30, 0.60, 1.0)
+# Dry minutes needed after a wet one before precipitation counts as ending
+SPELL_DRY_GAP = 5
+# Minutes that describe what is falling now
+NOW_MINUTES = 15
+
+
+def precip_type_code(precip_type: str | None) -> int:
+    """Return the integer code for a PirateWeather precipType."""
+    return _PRECIP_TYPE_CODES.get(precip_type or "none", 0)
+
+
+def _is_precip(intensity: float, probability: float) -> bool:
+    """Return True if a row shows precipitation (same thresholds as the card)."""
+    return (
+        intensity >= PRECIP_INTENSITY_THRESHOLD
+        and probability >= PRECIP_PROBABILITY_THRESHOLD
+    )
+
+
+def color_bucket(intensity: float, probability: float) -> int:
+    """Return the card's color bucket for a row's precipitation."""
+    if not _is_precip(intensity, probability):
+        return 0
+    return 1 + bisect_right(COLOR_BUCKET_LIMITS, intensity)
+
+
+def _dominant_type(codes: list[int]) -> int | None:
+    """Return the most common precipitation type code, ignoring 'none'.
+
+    Returns 0 when every code is 'none' and None when there are no codes.
+    """
+    counts = Counter(code for code in codes if code)
+    if not counts:
+        return 0 if codes else None
+    return counts.most_common(1)[0][0]
+
+
+def _floats(rows: list[dict[str, Any]], key: str) -> array:
+    """Return one numeric field of every row as a double array."""
+    return array("d", (float(row.get(key) or 0) for row in rows))
+
+
+def _optional_float(value: Any) -> float | None:
+    """Return a value as a float, keeping None for missing values."""
+    return None if value is None else float(value)
+
+
+class MinutelyForecast:
+    """Minutely precipitation window held as parallel typed arrays.
+
+    Only the fields used by adaptive polling and the card are kept; the rest
+    of each decoded minute is discarded at parse time.
+    """
+
+    __slots__ = ("time", "intensity", "probability", "error", "type")
+
+    def __init__(
+        self,
+        time: array,
+        intensity: array,
+        probability: array,
+        error: array,
+        type: array,  # noqa: A002
+    ) -> None:
+        self.time = time
+        self.intensity = intensity
+        self.probability = probability
+        self.error = error
+        self.type = type
+
+    @classmethod
+    def from_json(cls, block: dict[str, Any]) -> MinutelyForecast:
+        """Parse PirateWeather's minutely block."""
+        rows = block.get("data", [])
+        return cls(
+            array("q", (int(row.get("time") or 0) for row in rows)),
+            _floats(rows, "precipIntensity"),
+            _floats(rows, "precipProbability"),
+            _floats(rows, "precipIntensityError"),
+            array("b", (precip_type_code(row.get("precipType")) for row in rows)),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, list]) -> MinutelyForecast:
+        """Rebuild a window saved with as_dict."""
+        return cls(
+            array("q", data["time"]),
+            array("d", data["intensity"]),
+            array("d", data["probability"]),
+            array("d", data["error"]),
+            array("b", data["type"]),
+        )
+
+    def as_dict(self) -> dict[str, list]:
+        """Return the window as JSON-serializable lists for storage."""
+        return {name: getattr(self, name).tolist() for name in self.__slots__}
+
+    def is_precip(self, index: int) -> bool:
+        """Return True if a minute shows precipitation (same thresholds as the card)."""
+        return _is_precip(self.intensity[index], self.probability[index])
+
+    def maybe_precip(self, index: int) -> bool:
+        """Return True if precipitation is within a minute's intensity error."""
+        return (
+            self.intensity[index] + self.error[index] >= PRECIP_INTENSITY_THRESHOLD
+            and self.probability[index] >= ADAPTIVE_DRY_PROBABILITY
+        )
+
+    def advanced(
+        self, now: float, previous: MinutelyForecast | None = None
+    ) -> MinutelyForecast:
+        """Merge with the previous window and drop elapsed minutes.
+
+        Minutes present in both windows are taken from this one. Returns self
+        when there is nothing to merge and no minute has elapsed.
+        """
+        start = now - now % 60
+        sources = [(t, self, i) for i, t in enumerate(self.time)]
+        if previous is not None and sources:
+            own = set(self.time)
+            sources.extend(
+                (t, previous, i) for i, t in enumerate(previous.time) if t not in own
+            )
+            sources.sort(key=lambda source: source[0])
+        kept = [(window, i) for t, window, i in sources if t >= start]
+        if previous is None and len(kept) == len(self.time):
+            return self
+        return MinutelyForecast(
+            *(
+                array(
+                    getattr(self, name).typecode,
+                    (getattr(window, name)[i] for window, i in kept),
+                )
+                for name in self.__slots__
+            )
+        )
+
+    def columns(self) -> dict[str, list]:
+        """Return the window as parallel lists for the sensors and the card."""
+        return {
+            "time": self.time.tolist(),
+            "intensity": [round(value, 4) for value in self.intensity],
+            "probability": [round(value, 4) for value in self.probability],
+            "error": [round(value, 4) for value in self.error],
+            "type": self.type.tolist(),
+            "color": [
+                color_bucket(intensity, probability)
+                for intensity, probability in zip(self.intensity, self.probability)
+            ],
+        }
+
+    def outlook(self) -> dict[str, Any]:
+        """Return the precipitation outlook the card puts into words.
+
+        `starts_in`, `ends_in` and `duration` are minutes from the first row:
+        when the first upcoming spell starts and how long it lasts, or when
+        ongoing precipitation is followed by SPELL_DRY_GAP dry minutes (or
+        the window ends). `peak` is the highest wet-minute intensity and
+        `peak_now` the highest intensity in the next NOW_MINUTES. `type` is
+        the dominant type over all wet minutes and `type_now` over those in
+        the next NOW_MINUTES (None when they are dry).
+        """
+        count = len(self.time)
+        wet = [self.is_precip(i) for i in range(count)]
+        ongoing = bool(count) and wet[0]
+        starts_in = ends_in = duration = None
+        spell_start = -1
+        for i in range(count + 1):
+            if i < count and wet[i]:
+                if spell_start == -1:
+                    spell_start = i
+                if ongoing and ends_in is None and not any(
+                    wet[i + 1 : i + 1 + SPELL_DRY_GAP]
+                ):
+                    ends_in = i + 1
+                continue
+            if spell_start != -1 and not ongoing and starts_in is None:
+                starts_in = spell_start
+                duration = i - spell_start
+            spell_start = -1
+
+        wet_types = [code for code, is_wet in zip(self.type, wet) if is_wet]
+        now_types = [
+            code for code, is_wet in zip(self.type[:NOW_MINUTES], wet) if is_wet
+        ]
+        peak = max(
+            (value for value, is_wet in zip(self.intensity, wet) if is_wet),
+            default=0.0,
+        )
+        return {
+            "ongoing": ongoing,
+            "starts_in": starts_in,
+            "ends_in": ends_in,
+            "duration": duration,
+            "peak": round(peak, 4),
+            "peak_now": round(max(self.intensity[:NOW_MINUTES], default=0.0), 4),
+            "type": _dominant_type(wet_types),
+            "type_now": _dominant_type(now_types),
+        }
+
+
+class HourlyForecast:
+    """Next HOURLY_HOURS hours plus today's conditions, held compactly.
+
+    Keeps the hourly fields the card draws, the current temperature and wind
+    speed, and today's high and low; the remaining hours, the rest of the
+    daily block and all unused fields are discarded at parse time.
+    """
+
+    __slots__ = (
+        "time",
+        "icon",
+        "summary",
+        "temperature",
+        "intensity",
+        "probability",
+        "current_temperature",
+        "wind_speed",
+        "temperature_high",
+        "temperature_low",
+    )
+
+    def __init__(
+        self,
+        time: array,
+        icon: tuple[str, ...],
+        summary: tuple[str, ...],
+        temperature: array,
+        intensity: array,
+        probability: array,
+        current_temperature: float | None,
+        wind_speed: float | None,
+        temperature_high: float | None,
+        temperature_low: float | None,
+    ) -> None:
+        self.time = time
+        self.icon = icon
+        self.summary = summary
+        self.temperature = temperature
+        self.intensity = intensity
+        self.probability = probability
+        self.current_temperature = current_temperature
+        self.wind_speed = wind_speed
+        self.temperature_high = temperature_high
+        self.temperature_low = temperature_low
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> HourlyForecast:
+        """Parse PirateWeather's currently, hourly and daily blocks."""
+        rows = data.get("hourly", {}).get("data", [])[:HOURLY_HOURS]
+        currently = data.get("currently", {})
+        today = (data.get("daily", {}).get("data") or [{}])[0]
+        return cls(
+            array("q", (int(row.get("time") or 0) for row in rows)),
+            # Icons and summaries repeat from hour to hour; share one string each
+            tuple(sys.intern(row.get("icon") or "") for row in rows),
+            tuple(sys.intern(row.get("summary") or "") for row in rows),
+            _floats(rows, "temperature"),
+            _floats(rows, "precipIntensity"),
+            _floats(rows, "precipProbability"),
+            _optional_float(currently.get("temperature")),
+            _optional_float(currently.get("windSpeed")),
+            _optional_float(today.get("temperatureHigh")),
+            _optional_float(today.get("temperatureLow")),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> HourlyForecast:
+        """Rebuild a forecast saved with as_dict."""
+        return cls(
+            array("q", data["time"]),
+            tuple(sys.intern(icon) for icon in data["icon"]),
+            tuple(sys.intern(summary) for summary in data["summary"]),
+            array("d", data["temperature"]),
+            array("d", data["intensity"]),
+            array("d", data["probability"]),
+            data["current_temperature"],
+            data["wind_speed"],
+            data["temperature_high"],
+            data["temperature_low"],
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the forecast as JSON-serializable values for storage."""
+        data = {name: getattr(self, name) for name in self.__slots__}
+        return {
+            name: value.tolist() if isinstance(value, array) else value
+            for name, value in data.items()
+        }
+
+    def columns(self) -> dict[str, list]:
+        """Return the hours as parallel lists for the sensors and the card."""
+        return {
+            "time": self.time.tolist(),
+            "icon": list(self.icon),
+            "summary": list(self.summary),
+            "temperature": [round(value) for value in self.temperature],
+            "intensity": [round(value, 4) for value in self.intensity],
+            "probability": [round(value, 4) for value in self.probability],
+            "color": [
+                color_bucket(intensity, probability)
+                for intensity, probability in zip(self.intensity, self.probability)
+            ],
+        }
+
+    def outlook(self) -> dict[str, Any]:
+        """Return how many hours precipitation is expected to last.
+
+        `precip_hours` counts the current hour plus the consecutive wet hours
+        that follow it, as used when precipitation outlasts the minutely window.
+        """
+        hours = 1
+        for i in range(1, len(self.time)):
+            if not _is_precip(self.intensity[i], self.probability[i]):
+                break
+            hours += 1
+        return {"precip_hours": hours}
+
+
+def columns_delta(
+    old: dict[str, list] | None, new: dict[str, list]
+) -> dict[str, Any] | None:
+    """Return a delta turning `old` columns into `new`, or None to send in full.
+
+    The delta drops `shift` leading rows, truncates or extends to `length`
+    rows and then overwrites the rows listed in `index` with `values`.
+    """
+    if not old or not old["time"] or not new["time"]:
+        return None
+    try:
+        shift = old["time"].index(new["time"][0])
+    except ValueError:
+        return None
+
+    old_length = len(old["time"])
+    changed = [
+        i
+        for i in range(len(new["time"]))
+        if i + shift >= old_length
+        or any(old[col][i + shift] != values[i] for col, values in new.items())
+    ]
+    if len(changed) > len(new["time"]) // 2:
+        return None
+    return {
+        "shift": shift,
+        "length": len(new["time"]),
+        "index": changed,
+        "values": {col: [values[i] for i in changed] for col, values in new.items()},
+    }
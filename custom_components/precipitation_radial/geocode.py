@@ -0,0 +1,136 @@
+"""Cached reverse geocoding via Nominatim."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    GEOCODE_CACHE_SIZE,
+    GEOCODE_CACHE_TTL,
+    GEOCODE_MIN_REQUEST_SPACING,
+    LOGGER,
+    STORAGE_KEY_GEOCODE,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+from .util import grid_key, json_loads
+
+NOMINATIM_ENDPOINT = "https://nominatim.openstreetmap.org/reverse"
+DATA_GEOCODER = f"{DOMAIN}_geocoder"
+
+
+async def async_get_geocoder(hass: HomeAssistant) -> ReverseGeocoder:
+    """Return the shared reverse geocoder, loading its cache on first use."""
+    if (geocoder := hass.data.get(DATA_GEOCODER)) is None:
+        geocoder = hass.data[DATA_GEOCODER] = ReverseGeocoder(hass)
+        await geocoder.async_load()
+    return geocoder
+
+
+class ReverseGeocoder:
+    """Reverse geocoder with a persistent LRU cache keyed by grid cell.
+
+    Nearby coordinates in the same forecast grid cell share one cached place
+    name. Upstream lookups are serialized and spaced to respect Nominatim's
+    one request per second policy.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._store: Store = Store(hass, STORAGE_VERSION, STORAGE_KEY_GEOCODE)
+        self._cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = asyncio.Lock()
+        self._last_request = 0.0
+        self.stats: dict[str, int] = {"hits": 0, "misses": 0}
+
+    async def async_load(self) -> None:
+        """Load the cache from disk, dropping expired entries."""
+        stored = await self._store.async_load() or {}
+        now = time.time()
+        for key, item in stored.get("entries", {}).items():
+            if now - item["ts"] < GEOCODE_CACHE_TTL:
+                self._cache[key] = item
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the cache contents to persist."""
+        return {"entries": dict(self._cache)}
+
+    def _cached(self, key: str) -> str | None:
+        """Return a cached, unexpired place name and mark it recently used."""
+        item = self._cache.get(key)
+        if item is None:
+            return None
+        if time.time() - item["ts"] >= GEOCODE_CACHE_TTL:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return item["name"]
+
+    async def async_reverse_geocode(self, latitude: float, longitude: float) -> str:
+        """Return a 'City, State/Region' string for a coordinate."""
+        key = grid_key(latitude, longitude)
+        if (name := self._cached(key)) is not None:
+            self.stats["hits"] += 1
+            return name
+
+        async with self._lock:
+            # Another caller may have resolved this cell while we waited
+            if (name := self._cached(key)) is not None:
+                self.stats["hits"] += 1
+                return name
+
+            self.stats["misses"] += 1
+            wait = self._last_request + GEOCODE_MIN_REQUEST_SPACING - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                name = await self._async_lookup(latitude, longitude)
+            finally:
+                self._last_request = time.monotonic()
+
+            if name:
+                self._cache[key] = {"name": name, "ts": time.time()}
+                while len(self._cache) > GEOCODE_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+                self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+            return name
+
+    async def _async_lookup(self, latitude: float, longitude: float) -> str:
+        """Query Nominatim for a coordinate."""
+        session = async_get_clientsession(self.hass)
+        url = f"{NOMINATIM_ENDPOINT}?lat={latitude}&lon={longitude}&format=json&zoom=10"
+        headers = {"User-Agent": "HomeAssistant-PrecipitationRadialCard/1.0"}
+        try:
+            async with session.get(url, headers=headers, timeout=10) as resp:
+                if resp.status != 200:
+                    return ""
+                data = json_loads(await resp.read())
+                addr = data.get("address", {})
+                city = (
+                    addr.get("city")
+                    or addr.get("town")
+                    or addr.get("village")
+                    or addr.get("municipality")
+                    or addr.get("hamlet")
+                    or ""
+                )
+                region = (
+                    addr.get("state")
+                    or addr.get("province")
+                    or addr.get("region")
+                    or addr.get("county")
+                    or ""
+                )
+                parts = [p for p in (city, region) if p]
+                return ", ".join(parts)
+        except Exception:
+            LOGGER.debug("Reverse geocode failed for %s,%s", latitude, longitude)
+            return ""
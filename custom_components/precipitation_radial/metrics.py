@@ -0,0 +1,85 @@
+"""Lightweight performance instrumentation for a config entry."""
+
+from __future__ import annotations
+
+import time
+from collections import defaultdict, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from .const import METRICS_SAMPLES
+
+
+class Samples:
+    """The most recent METRICS_SAMPLES durations of one operation."""
+
+    __slots__ = ("_values", "count")
+
+    def __init__(self) -> None:
+        self._values: deque[float] = deque(maxlen=METRICS_SAMPLES)
+        self.count = 0
+
+    def add(self, seconds: float) -> None:
+        """Record one duration."""
+        self._values.append(seconds * 1000)
+        self.count += 1
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return a nearest-rank percentile in milliseconds."""
+        if not self._values:
+            return None
+        ordered = sorted(self._values)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the count, last value and percentiles in milliseconds."""
+        if not self._values:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "last_ms": round(self._values[-1], 1),
+            "p50_ms": round(self.percentile(0.5), 1),
+            "p95_ms": round(self.percentile(0.95), 1),
+            "max_ms": round(max(self._values), 1),
+        }
+
+
+class EntryMetrics:
+    """Timings and sizes recorded while an entry fetches and publishes data.
+
+    Timings are kept per operation name; sizes are the latest value, or a
+    running total for `bytes_received`.
+    """
+
+    def __init__(self) -> None:
+        self.timings: defaultdict[str, Samples] = defaultdict(Samples)
+        self.sizes: dict[str, int] = {"bytes_received": 0}
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record the duration of one operation."""
+        self.timings[name].add(seconds)
+
+    @contextmanager
+    def timed(self, name: str) -> Iterator[None]:
+        """Record how long the enclosed block takes, even if it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name].add(time.perf_counter() - start)
+
+    def received(self, size: int) -> None:
+        """Count one upstream response body."""
+        self.sizes["bytes_received"] += size
+        self.sizes["payload_bytes"] = size
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all metrics for diagnostics."""
+        return {
+            "timings": {
+                name: samples.as_dict()
+                for name, samples in sorted(self.timings.items())
+            },
+            "sizes": dict(self.sizes),
+        }
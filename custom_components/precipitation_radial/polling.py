@@ -0,0 +1,69 @@
+"""Adaptive polling for the minutely forecast."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from .const import ADAPTIVE_DRY_PROBABILITY
+from .forecast import MinutelyForecast
+
+
+def minutes_to_change(forecast: MinutelyForecast) -> int | None:
+    """Return minutes until precipitation starts or ends, or None if steady."""
+    if not forecast.time:
+        return None
+    wet_now = forecast.is_precip(0)
+    for minute in range(1, len(forecast.time)):
+        if forecast.is_precip(minute) != wet_now or (
+            not wet_now and forecast.maybe_precip(minute)
+        ):
+            return minute
+    return None
+
+
+class AdaptivePolling:
+    """Choose the minutely poll interval from the latest minutely forecast.
+
+    Polls faster as a precipitation onset or end approaches, backs off when
+    the hour is dry, and never makes more upstream minutely polls per day
+    than the daily call budget.
+    """
+
+    def __init__(self, min_interval: int, max_interval: int, daily_budget: int) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.daily_budget = daily_budget
+
+    def _budget_floor(self, calls_today: int, now: datetime) -> float:
+        """Return the shortest interval that keeps today's calls within budget."""
+        remaining_calls = self.daily_budget - calls_today
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        remaining_seconds = 86400 - (now - midnight).total_seconds()
+        return remaining_seconds / max(1, remaining_calls)
+
+    def next_interval(
+        self,
+        forecast: MinutelyForecast,
+        base_interval: int,
+        calls_today: int,
+        now: datetime,
+    ) -> int:
+        """Return the number of seconds until the next minutely poll.
+
+        `calls_today` counts the upstream calls minutely polls made since
+        local midnight.
+        """
+        lead = minutes_to_change(forecast)
+        if lead is not None:
+            # Poll about twice before the expected change
+            interval = min(lead * 60 / 2, base_interval)
+        elif forecast.time and not forecast.is_precip(0) and all(
+            probability < ADAPTIVE_DRY_PROBABILITY
+            for probability in forecast.probability
+        ):
+            interval = self.max_interval
+        else:
+            interval = base_interval
+
+        interval = min(max(interval, self.min_interval), self.max_interval)
+        return int(max(interval, self._budget_floor(calls_today, now)))
@@ -0,0 +1,187 @@
+"""PirateWeather API quota accounting."""
+
+from __future__ import annotations
+
+import calendar
+import time
+from collections.abc import Mapping
+from datetime import date, datetime, timezone
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DEFAULT_MONTHLY_CALL_LIMIT,
+    DOMAIN,
+    STORAGE_KEY_QUOTA,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+from .util import api_key_id
+
+DATA_QUOTA = f"{DOMAIN}_quota"
+
+
+async def async_get_quota(hass: HomeAssistant, api_key: str) -> ApiQuota:
+    """Return the shared quota tracker for an API key."""
+    if (registry := hass.data.get(DATA_QUOTA)) is None:
+        registry = hass.data[DATA_QUOTA] = QuotaRegistry(hass)
+        await registry.async_load()
+    return registry.get(api_key)
+
+
+def _int_header(headers: Mapping[str, str], name: str) -> int | None:
+    """Return an integer response header, or None if missing or malformed."""
+    try:
+        return int(float(headers[name]))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _next_month_start(now: float) -> float:
+    """Return the UTC timestamp at which the current calendar month ends."""
+    today = datetime.fromtimestamp(now, timezone.utc)
+    days = calendar.monthrange(today.year, today.month)[1]
+    start = today.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    return start.timestamp() + days * 86400
+
+
+class QuotaRegistry:
+    """Quota trackers for every API key in use, persisted across restarts."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store: Store = Store(hass, STORAGE_VERSION, STORAGE_KEY_QUOTA)
+        self._quotas: dict[str, ApiQuota] = {}
+        self._stored: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load saved quota state."""
+        self._stored = (await self._store.async_load() or {}).get("keys", {})
+
+    def get(self, api_key: str) -> ApiQuota:
+        """Return the tracker for an API key, creating it if needed."""
+        key_id = api_key_id(api_key)
+        if (quota := self._quotas.get(key_id)) is None:
+            quota = self._quotas[key_id] = ApiQuota(self, self._stored.get(key_id))
+        return quota
+
+    def async_schedule_save(self) -> None:
+        """Persist all trackers after a short delay."""
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "keys": {key_id: quota.as_dict() for key_id, quota in self._quotas.items()}
+        }
+
+
+class ApiQuota:
+    """Call usage for one API key over its billing period.
+
+    Usage comes from PirateWeather's rate-limit response headers when they
+    are present, and from a local call count otherwise. Entries register
+    their nominal call rate so poll intervals can be stretched to make the
+    remaining calls last until the period resets.
+    """
+
+    def __init__(self, registry: QuotaRegistry, stored: dict[str, Any] | None) -> None:
+        self._registry = registry
+        stored = stored or {}
+        self.limit: int = stored.get("limit", DEFAULT_MONTHLY_CALL_LIMIT)
+        self.used: int = stored.get("used", 0)
+        self.remaining: int | None = stored.get("remaining")
+        self.reset_at: float = stored.get("reset_at") or _next_month_start(time.time())
+        self.from_headers: bool = stored.get("from_headers", False)
+        # Per consumer: the local day and the minutely polls made on it
+        self._daily: dict[str, list] = stored.get("daily", {})
+        self._demand: dict[str, float] = {}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the persisted state."""
+        return {
+            "limit": self.limit,
+            "used": self.used,
+            "remaining": self.remaining,
+            "reset_at": self.reset_at,
+            "from_headers": self.from_headers,
+            "daily": self._daily,
+        }
+
+    def set_demand(self, consumer: str, interval: float) -> None:
+        """Register a consumer's nominal seconds between upstream calls."""
+        self._demand[consumer] = 1 / interval
+
+    def remove_demand(self, consumer: str) -> None:
+        """Forget a consumer's nominal call rate."""
+        self._demand.pop(consumer, None)
+
+    def count_daily(self, consumer: str, day: date) -> None:
+        """Count one of a consumer's budgeted calls on a local day."""
+        today = day.isoformat()
+        # Counts from earlier days are no longer needed by anyone
+        self._daily = {
+            name: counted
+            for name, counted in self._daily.items()
+            if counted[0] == today
+        }
+        self._daily[consumer] = [today, self.daily_calls(consumer, day) + 1]
+        self._registry.async_schedule_save()
+
+    def daily_calls(self, consumer: str, day: date) -> int:
+        """Return a consumer's budgeted calls on a local day."""
+        counted = self._daily.get(consumer)
+        if counted is None or counted[0] != day.isoformat():
+            return 0
+        return counted[1]
+
+    def _roll_period(self, now: float) -> None:
+        """Start a new period once the reset time has passed."""
+        if now < self.reset_at:
+            return
+        self.used = 0
+        self.remaining = None
+        self.reset_at = _next_month_start(now)
+
+    def record(self, status: int, headers: Mapping[str, str]) -> None:
+        """Account for one upstream call and its rate-limit headers."""
+        now = time.time()
+        self._roll_period(now)
+        self.used += 1
+
+        limit = _int_header(headers, "RateLimit-Limit")
+        remaining = _int_header(headers, "RateLimit-Remaining")
+        reset = _int_header(headers, "RateLimit-Reset")
+        calls = _int_header(headers, "X-Forecast-API-Calls")
+        if limit is not None:
+            self.limit = limit
+        if reset is not None:
+            self.reset_at = now + reset
+        if remaining is None and calls is not None and limit is not None:
+            remaining = limit - calls
+        self.from_headers = remaining is not None
+        if remaining is None:
+            remaining = self.limit - self.used
+        if status == 429:
+            remaining = 0
+        self.remaining = max(0, remaining)
+        self._registry.async_schedule_save()
+
+    @property
+    def stretch(self) -> float:
+        """Return the factor by which poll intervals must grow to stay in budget."""
+        now = time.time()
+        self._roll_period(now)
+        remaining = self.remaining if self.remaining is not None else self.limit - self.used
+        demand = sum(self._demand.values())
+        if remaining <= 0 or demand <= 0:
+            return 1.0
+        return max(1.0, demand * (self.reset_at - now) / remaining)
+
+    def adjust(self, seconds: float) -> float:
+        """Return a poll interval adjusted for the remaining quota."""
+        self._roll_period(time.time())
+        if self.remaining == 0:
+            # Exhausted: wait for the period to reset
+            return max(seconds, self.reset_at - time.time())
+        return seconds * self.stretch
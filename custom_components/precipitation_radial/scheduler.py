@@ -0,0 +1,110 @@
+"""Staggered, phase-aligned poll scheduling across config entries."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DOMAIN,
+    MINUTELY_MODEL_CADENCE,
+    MINUTELY_MODEL_LAG,
+    SCHEDULER_ALIGN_SPREAD,
+    SCHEDULER_CATCHUP_WINDOW,
+    SCHEDULER_MIN_DELAY,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import ForecastCoordinator
+
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+
+
+def get_poll_scheduler(hass: HomeAssistant) -> PollScheduler:
+    """Return the process-wide poll scheduler."""
+    if (scheduler := hass.data.get(DATA_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_SCHEDULER] = PollScheduler()
+    return scheduler
+
+
+class PollScheduler:
+    """Assign every coordinator a fixed phase within its poll interval.
+
+    Coordinators of the same block are spread evenly across the interval by
+    the rank of their grid cell and API key, so entries sharing both keep
+    polling together and share one upstream call. Polls land on the slot nearest to
+    one interval after the last fetch, which keeps the average interval
+    unchanged. Minutely slots are anchored just after the upstream model
+    steps so each call is more likely to return new data; intervals shorter
+    than a step are rounded up to an even split of it.
+    """
+
+    def __init__(self) -> None:
+        self._coordinators: dict[str, set[ForecastCoordinator]] = {}
+
+    def add(self, coordinator: ForecastCoordinator) -> None:
+        """Start scheduling a coordinator."""
+        self._coordinators.setdefault(coordinator.block, set()).add(coordinator)
+
+    def remove(self, coordinator: ForecastCoordinator) -> None:
+        """Stop scheduling a coordinator."""
+        self._coordinators.get(coordinator.block, set()).discard(coordinator)
+
+    def phase(self, coordinator: ForecastCoordinator) -> float:
+        """Return the coordinator's phase as a fraction of its interval."""
+        cells = sorted(
+            {
+                member.fetcher.share_key(
+                    member.fetcher.latitude, member.fetcher.longitude
+                )
+                for member in self._coordinators.get(coordinator.block, ())
+            }
+        )
+        cell = coordinator.fetcher.share_key(
+            coordinator.fetcher.latitude, coordinator.fetcher.longitude
+        )
+        if cell not in cells:
+            return 0.0
+        return cells.index(cell) / len(cells)
+
+    def delay(
+        self,
+        coordinator: ForecastCoordinator,
+        interval: float,
+        last_fetch: float | None,
+        now: float,
+        align: bool = False,
+    ) -> float:
+        """Return the seconds until a coordinator's next poll.
+
+        `last_fetch` and `now` are wall-clock timestamps; `align` anchors the
+        slots to the minutely model cadence.
+        """
+        if last_fetch is None:
+            return interval
+        fraction = self.phase(coordinator)
+        due = last_fetch + interval
+        if due <= now:
+            return SCHEDULER_MIN_DELAY + fraction * SCHEDULER_CATCHUP_WINDOW
+
+        if align:
+            # Slots sit just after every model step, or split each step evenly
+            # when the interval is shorter, never polling more often than asked
+            period = MINUTELY_MODEL_CADENCE / max(
+                1, int(MINUTELY_MODEL_CADENCE // interval)
+            )
+            spread = min(period, SCHEDULER_ALIGN_SPREAD)
+            offset = MINUTELY_MODEL_LAG + fraction * spread
+            # Snap the due time's place on the interval grid rather than the
+            # due time itself, so steps rounded down and up even out
+            due = round(due / interval) * interval
+        else:
+            period = interval
+            offset = fraction * interval
+
+        slot = offset + round((due - offset) / period) * period
+        earliest = max(now + SCHEDULER_MIN_DELAY, last_fetch + interval / 2)
+        while slot < earliest:
+            slot += period
+        return slot - now
@@ -11,15 +11,23 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfSpeed, UnitOfTemperature
+from homeassistant.const import (
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfTime,
+)
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .api import STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN, get_circuit_breaker
+from .const import API_ENDPOINT, CONF_UNIT_SYSTEM, DOMAIN, SIGNAL_LOCATION_NAME
 from .coordinator import HourlyCoordinator, MinutelyCoordinator
+from .metrics import EntryMetrics
+from .units import ForecastUnits, entry_units
 
 
 async def async_setup_entry(
@@ -49,6 +57,11 @@ async def async_setup_entry(
             TodayHighTemperatureSensor(hourly_coord, entry, device_info),
             TodayLowTemperatureSensor(hourly_coord, entry, device_info),
             CurrentWindSpeedSensor(hourly_coord, entry, device_info),
+            ApiCallsRemainingSensor(minutely_coord, entry, device_info),
+            ApiConnectionSensor(minutely_coord, entry, device_info),
+            UpstreamLatencySensor(minutely_coord, entry, device_info),
+            UpdateDurationSensor(minutely_coord, entry, device_info),
+            PayloadSizeSensor(minutely_coord, entry, device_info),
         ]
     )
 
@@ -70,43 +83,121 @@ class PrecipitationRadialSensor(CoordinatorEntity, SensorEntity):
         self._attr_device_info = device_info
 
 
-class MinutelyForecastSensor(PrecipitationRadialSensor):
+def _rows_by_time(columns: dict[str, list]) -> dict[int, tuple]:
+    """Return the forecast values of each row keyed by its timestamp."""
+    values = [column for name, column in columns.items() if name != "time"]
+    return dict(zip(columns["time"], zip(*values)))
+
+
+def _content_changed(
+    old: dict[int, tuple] | None, new: dict[int, tuple] | None
+) -> bool:
+    """Return True if the forecast values differ between two windows.
+
+    Rows are compared by timestamp, so a window that only slid forward
+    (dropping elapsed rows and adding new ones at its end) is unchanged.
+    """
+    if old is None or new is None:
+        return old is not new
+    shared = old.keys() & new.keys()
+    return not shared or any(old[t] != new[t] for t in shared)
+
+
+class ForecastDataSensor(PrecipitationRadialSensor):
+    """Base class for the minutely and hourly forecast sensors.
+
+    The forecast itself is delivered to the card over the websocket API; the
+    state is the time the forecast values last changed, so polls that
+    return the same values for the same times produce no new state and no
+    recorder write.
+    """
+
+    def __init__(self, coordinator, entry, device_info, key: str) -> None:
+        super().__init__(coordinator, entry, device_info, key)
+        self._rows: dict[int, tuple] | None = None
+        self._changed_at: str | None = None
+        self._was_available: bool | None = None
+
+    def _update_content(self) -> bool:
+        """Compare the forecast with the last one; return True if it changed."""
+        with self.coordinator.fetcher.metrics.timed(
+            f"attributes_{self.coordinator.block}"
+        ):
+            rows = (
+                _rows_by_time(self.coordinator.columns)
+                if self.coordinator.data
+                else None
+            )
+            changed = _content_changed(self._rows, rows)
+        self._rows = rows
+        if not changed:
+            return False
+        self._changed_at = (
+            datetime.now(timezone.utc).isoformat() if rows is not None else None
+        )
+        return True
+
+    async def async_added_to_hass(self) -> None:
+        self._update_content()
+        self._was_available = self.available
+        await super().async_added_to_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        changed = self._update_content()
+        available = self.available
+        if not changed and available == self._was_available:
+            return
+        self._was_available = available
+        super()._handle_coordinator_update()
+        if (state := self.hass.states.get(self.entity_id)) is not None:
+            self.coordinator.fetcher.metrics.sizes[
+                f"state_bytes_{self.coordinator.block}"
+            ] = len(state.as_dict_json)
+
+    @property
+    def native_value(self) -> str | None:
+        return self._changed_at
+
+
+class MinutelyForecastSensor(ForecastDataSensor):
     """Minutely precipitation forecast data."""
 
     def __init__(self, coordinator, entry, device_info, location_name: str = "") -> None:
         super().__init__(coordinator, entry, device_info, "minutely_forecast")
         self._attr_name = "Minutely Forecast"
         self._attr_icon = "mdi:weather-rainy"
+        self._entry_id = entry.entry_id
         self._location_name = location_name
 
-    @property
-    def native_value(self) -> str | None:
-        if self.coordinator.data:
-            return datetime.now(timezone.utc).isoformat()
-        return None
+    async def async_added_to_hass(self) -> None:
+        # The place name resolves in the background after setup
+        self._location_name = self.hass.data[DOMAIN][self._entry_id].get(
+            "location_name", self._location_name
+        )
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_LOCATION_NAME.format(self._entry_id),
+                self._handle_location_name,
+            )
+        )
+        await super().async_added_to_hass()
+
+    @callback
+    def _handle_location_name(self, location_name: str) -> None:
+        """Update the place name attribute once it resolves."""
+        if location_name == self._location_name:
+            return
+        self._location_name = location_name
+        self.async_write_ha_state()
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        if not self.coordinator.data:
-            return {"data": [], "location_name": self._location_name}
-        minutely = self.coordinator.data.get("minutely", {})
-        raw = minutely.get("data", [])
-        return {
-            "location_name": self._location_name,
-            "data": [
-                {
-                    "time": item.get("time"),
-                    "precipIntensity": round(float(item.get("precipIntensity", 0)), 4),
-                    "precipProbability": round(float(item.get("precipProbability", 0)), 4),
-                    "precipIntensityError": round(float(item.get("precipIntensityError", 0)), 4),
-                    "precipType": item.get("precipType", "none"),
-                }
-                for item in raw
-            ],
-        }
+        return {"location_name": self._location_name}
 
 
-class HourlyForecastSensor(PrecipitationRadialSensor):
+class HourlyForecastSensor(ForecastDataSensor):
     """Hourly precipitation forecast data."""
 
     def __init__(self, coordinator, entry, device_info) -> None:
@@ -114,38 +205,37 @@ class HourlyForecastSensor(PrecipitationRadialSensor):
         self._attr_name = "Hourly Forecast"
         self._attr_icon = "mdi:weather-partly-cloudy"
 
+
+class ConvertedSensor(PrecipitationRadialSensor):
+    """Base class for sensors shown in the entry's unit system.
+
+    Forecast values stay in the units they were fetched in and are converted
+    when read, so changing the entry's units needs no new API call.
+    """
+
+    def __init__(self, coordinator, entry, device_info, key: str) -> None:
+        super().__init__(coordinator, entry, device_info, key)
+        self._entry_id = entry.entry_id
+
     @property
-    def native_value(self) -> str | None:
-        if self.coordinator.data:
-            return datetime.now(timezone.utc).isoformat()
-        return None
+    def _units(self) -> ForecastUnits:
+        settings = self.hass.data[DOMAIN][self._entry_id]["settings"]
+        return entry_units(self.hass, settings[CONF_UNIT_SYSTEM])
+
+
+class TemperatureSensor(ConvertedSensor):
+    """Base class for the temperature sensors."""
+
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        if not self.coordinator.data:
-            return {"data": []}
-        hourly = self.coordinator.data.get("hourly", {})
-        data = hourly.get("data", [])[:24]
-        return {
-            "data": [
-                {
-                    "time": item.get("time"),
-                    "icon": item.get("icon", ""),
-                    "summary": item.get("summary", ""),
-                    "temperature": round(float(item.get("temperature", 0))),
-                    "precipIntensity": round(float(item.get("precipIntensity", 0)), 4),
-                    "precipProbability": round(float(item.get("precipProbability", 0)), 4),
-                }
-                for item in data
-            ]
-        }
+    def native_unit_of_measurement(self) -> str:
+        return self._units.temperature_unit
 
 
-class CurrentApparentTemperatureSensor(PrecipitationRadialSensor):
+class CurrentApparentTemperatureSensor(TemperatureSensor):
     """Current actual temperature."""
 
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_suggested_display_precision = 1
 
@@ -159,16 +249,13 @@ class CurrentApparentTemperatureSensor(PrecipitationRadialSensor):
     def native_value(self) -> float | None:
         if not self.coordinator.data:
             return None
-        currently = self.coordinator.data.get("currently", {})
-        val = currently.get("temperature")
-        return round(float(val), 1) if val is not None else None
+        val = self.coordinator.data.current_temperature
+        return round(self._units.temperature(val), 1) if val is not None else None
 
 
-class TodayHighTemperatureSensor(PrecipitationRadialSensor):
+class TodayHighTemperatureSensor(TemperatureSensor):
     """Today's high temperature from PirateWeather daily forecast."""
 
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_suggested_display_precision = 0
 
@@ -182,19 +269,13 @@ class TodayHighTemperatureSensor(PrecipitationRadialSensor):
     def native_value(self) -> float | None:
         if not self.coordinator.data:
             return None
-        daily = self.coordinator.data.get("daily", {})
-        data = daily.get("data", [])
-        if not data:
-            return None
-        val = data[0].get("temperatureHigh")
-        return round(float(val)) if val is not None else None
+        val = self.coordinator.data.temperature_high
+        return round(self._units.temperature(val)) if val is not None else None
 
 
-class TodayLowTemperatureSensor(PrecipitationRadialSensor):
+class TodayLowTemperatureSensor(TemperatureSensor):
     """Today's low temperature from PirateWeather daily forecast."""
 
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_suggested_display_precision = 0
 
@@ -208,19 +289,14 @@ class TodayLowTemperatureSensor(PrecipitationRadialSensor):
     def native_value(self) -> float | None:
         if not self.coordinator.data:
             return None
-        daily = self.coordinator.data.get("daily", {})
-        data = daily.get("data", [])
-        if not data:
-            return None
-        val = data[0].get("temperatureLow")
-        return round(float(val)) if val is not None else None
+        val = self.coordinator.data.temperature_low
+        return round(self._units.temperature(val)) if val is not None else None
 
 
-class CurrentWindSpeedSensor(PrecipitationRadialSensor):
+class CurrentWindSpeedSensor(ConvertedSensor):
     """Current wind speed."""
 
     _attr_device_class = SensorDeviceClass.WIND_SPEED
-    _attr_native_unit_of_measurement = UnitOfSpeed.MILES_PER_HOUR
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_suggested_display_precision = 0
 
@@ -234,6 +310,167 @@ class CurrentWindSpeedSensor(PrecipitationRadialSensor):
     def native_value(self) -> float | None:
         if not self.coordinator.data:
             return None
-        currently = self.coordinator.data.get("currently", {})
-        val = currently.get("windSpeed")
-        return round(float(val)) if val is not None else None
+        val = self.coordinator.data.wind_speed
+        return round(self._units.wind_speed(val), 1) if val is not None else None
+
+    @property
+    def native_unit_of_measurement(self) -> str:
+        return self._units.wind_speed_unit
+
+
+class ApiCallsRemainingSensor(PrecipitationRadialSensor):
+    """PirateWeather API calls left in the current billing period."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:api"
+
+    def __init__(self, coordinator, entry, device_info) -> None:
+        super().__init__(coordinator, entry, device_info, "api_calls_remaining")
+        self._attr_name = "API Calls Remaining"
+
+    @property
+    def native_value(self) -> int | None:
+        quota = self.coordinator.fetcher.quota
+        if quota.remaining is None:
+            return None
+        return quota.remaining
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        quota = self.coordinator.fetcher.quota
+        return {
+            "limit": quota.limit,
+            "used": quota.used,
+            "resets": datetime.fromtimestamp(quota.reset_at, timezone.utc).isoformat(),
+            "source": "headers" if quota.from_headers else "local",
+            "interval_stretch": round(quota.stretch, 2),
+        }
+
+
+class ApiConnectionSensor(PrecipitationRadialSensor):
+    """State of the circuit breaker guarding PirateWeather requests."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = [STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN]
+    _attr_icon = "mdi:cloud-sync"
+
+    def __init__(self, coordinator, entry, device_info) -> None:
+        super().__init__(coordinator, entry, device_info, "api_connection")
+        self._attr_name = "API Connection"
+
+    @property
+    def available(self) -> bool:
+        # Most informative precisely when forecast updates are failing
+        return True
+
+    @property
+    def native_value(self) -> str:
+        return get_circuit_breaker(self.hass, API_ENDPOINT).state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        breaker = get_circuit_breaker(self.hass, API_ENDPOINT)
+        stats = self.coordinator.fetcher.stats
+        return {
+            "consecutive_failures": breaker.failures,
+            "retries": breaker.stats["retries"],
+            "rejected": breaker.stats["rejected"],
+            "times_opened": breaker.stats["opened"],
+            "entry_retries": stats["retries"],
+            "stale_served": stats["stale_served"],
+        }
+
+
+class MetricsSensor(PrecipitationRadialSensor):
+    """Base class for the optional performance diagnostic sensors."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def _metrics(self) -> EntryMetrics:
+        return self.coordinator.fetcher.metrics
+
+    def _timings(self, *names: str) -> dict[str, Any]:
+        """Return the recorded timings among the given operations."""
+        timings = self._metrics.timings
+        return {name: timings[name].as_dict() for name in names if name in timings}
+
+    def _p95(self, name: str) -> float | None:
+        if (samples := self._metrics.timings.get(name)) is None:
+            return None
+        value = samples.percentile(0.95)
+        return round(value, 1) if value is not None else None
+
+
+class UpstreamLatencySensor(MetricsSensor):
+    """95th percentile PirateWeather response time, including retries."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(self, coordinator, entry, device_info) -> None:
+        super().__init__(coordinator, entry, device_info, "upstream_latency")
+        self._attr_name = "Upstream Latency"
+
+    @property
+    def native_value(self) -> float | None:
+        return self._p95("upstream")
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return self._timings("upstream", "geocode")
+
+
+class UpdateDurationSensor(MetricsSensor):
+    """95th percentile time to refresh the minutely forecast."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_icon = "mdi:timer-cog-outline"
+
+    def __init__(self, coordinator, entry, device_info) -> None:
+        super().__init__(coordinator, entry, device_info, "update_duration")
+        self._attr_name = "Update Duration"
+
+    @property
+    def native_value(self) -> float | None:
+        return self._p95("update_minutely")
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return self._timings(
+            "update_minutely",
+            "update_hourly",
+            "decode",
+            "parse",
+            "attributes_minutely",
+            "attributes_hourly",
+            "register_card",
+        )
+
+
+class PayloadSizeSensor(MetricsSensor):
+    """Size of the latest PirateWeather response body."""
+
+    _attr_device_class = SensorDeviceClass.DATA_SIZE
+    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
+    _attr_icon = "mdi:file-download-outline"
+
+    def __init__(self, coordinator, entry, device_info) -> None:
+        super().__init__(coordinator, entry, device_info, "payload_size")
+        self._attr_name = "Payload Size"
+
+    @property
+    def native_value(self) -> int | None:
+        return self._metrics.sizes.get("payload_bytes")
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        sizes = dict(self._metrics.sizes)
+        sizes.pop("payload_bytes", None)
+        return sizes
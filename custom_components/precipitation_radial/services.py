@@ -0,0 +1,189 @@
+"""On-demand forecast service for the Precipitation Radial Card integration."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+import voluptuous as vol
+
+import homeassistant.helpers.config_validation as cv
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_LATITUDE,
+    CONF_LONGITUDE,
+    CONF_UNIT_SYSTEM,
+    DOMAIN,
+    GET_FORECAST_CACHE_HOURLY_TTL,
+    GET_FORECAST_CACHE_SIZE,
+    GET_FORECAST_CACHE_TTL,
+)
+from .coordinator import ForecastFetcher
+from .units import ForecastUnits, entry_units
+
+DATA_SERVICE_CACHE = f"{DOMAIN}_service_cache"
+
+SERVICE_GET_FORECAST = "get_forecast"
+ATTR_ENTRY_ID = "entry_id"
+ATTR_BLOCKS = "blocks"
+ATTR_EXTENDED = "extended"
+
+SERVICE_BLOCKS = ("currently", "minutely", "hourly", "daily", "alerts")
+DEFAULT_SERVICE_BLOCKS = ["hourly", "daily"]
+# Blocks that change faster than the hourly forecast
+_FAST_CHANGING_BLOCKS = frozenset({"currently", "minutely", "alerts"})
+
+SERVICE_GET_FORECAST_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Inclusive(CONF_LATITUDE, "location"): cv.latitude,
+        vol.Inclusive(CONF_LONGITUDE, "location"): cv.longitude,
+        vol.Optional(ATTR_BLOCKS, default=DEFAULT_SERVICE_BLOCKS): vol.All(
+            cv.ensure_list, [vol.In(SERVICE_BLOCKS)], vol.Length(min=1)
+        ),
+        vol.Optional(ATTR_EXTENDED, default=False): cv.boolean,
+    }
+)
+
+
+def get_service_cache(hass: HomeAssistant) -> ForecastResponseCache:
+    """Return the process-wide get_forecast response cache."""
+    if (cache := hass.data.get(DATA_SERVICE_CACHE)) is None:
+        cache = hass.data[DATA_SERVICE_CACHE] = ForecastResponseCache()
+    return cache
+
+
+class ForecastResponseCache:
+    """Recent decoded forecasts for get_forecast, keyed by grid cell and key.
+
+    A cached forecast answers any request for blocks it carries, so the ones
+    fetched while prewarming favorite locations serve get_forecast for those
+    cells too. Minutely, currently and alerts are reused for
+    GET_FORECAST_CACHE_TTL seconds, hourly and daily for
+    GET_FORECAST_CACHE_HOURLY_TTL. At most GET_FORECAST_CACHE_SIZE forecasts
+    are kept, dropping the least recently used. They are kept in the units
+    they were fetched in and converted per caller, so entries that only
+    differ in units share them.
+    """
+
+    def __init__(self) -> None:
+        self._payloads: OrderedDict[
+            tuple[str, bool, frozenset[str]], tuple[float, float, dict[str, Any]]
+        ] = OrderedDict()
+        self.stats: dict[str, int] = {"hits": 0, "misses": 0}
+
+    def get(
+        self, cell: str, extended: bool, blocks: frozenset[str]
+    ) -> tuple[dict[str, Any], float] | None:
+        """Return a fresh forecast carrying the blocks and when it was fetched."""
+        max_age = (
+            GET_FORECAST_CACHE_TTL
+            if blocks & _FAST_CHANGING_BLOCKS
+            else GET_FORECAST_CACHE_HOURLY_TTL
+        )
+        now = time.monotonic()
+        for key, cached in reversed(self._payloads.items()):
+            if (
+                key[:2] == (cell, extended)
+                and blocks <= key[2]
+                and now - cached[0] < max_age
+            ):
+                self._payloads.move_to_end(key)
+                self.stats["hits"] += 1
+                return cached[2], cached[1]
+        self.stats["misses"] += 1
+        return None
+
+    def put(
+        self,
+        cell: str,
+        extended: bool,
+        blocks: frozenset[str],
+        payload: dict[str, Any],
+    ) -> None:
+        """Store a decoded forecast carrying the given blocks."""
+        key = (cell, extended, blocks)
+        self._payloads[key] = (time.monotonic(), time.time(), payload)
+        self._payloads.move_to_end(key)
+        while len(self._payloads) > GET_FORECAST_CACHE_SIZE:
+            self._payloads.popitem(last=False)
+
+
+def _response(
+    payload: dict[str, Any],
+    fetched_at: float,
+    blocks: list[str],
+    units: ForecastUnits,
+) -> dict[str, Any]:
+    """Return the requested blocks of a decoded forecast as service data."""
+    response: dict[str, Any] = {
+        "latitude": payload.get("latitude"),
+        "longitude": payload.get("longitude"),
+        "timezone": payload.get("timezone"),
+        "fetched_at": dt_util.utc_from_timestamp(fetched_at).isoformat(),
+        "units": units.as_dict(),
+    }
+    for block in blocks:
+        if block == "currently":
+            response[block] = units.convert_row(payload.get(block, {}))
+        elif block == "alerts":
+            response[block] = payload.get(block, [])
+        else:
+            response[block] = [
+                units.convert_row(row) for row in payload.get(block, {}).get("data", [])
+            ]
+    return response
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's entry-independent services."""
+
+    async def handle_get_forecast(call: ServiceCall) -> ServiceResponse:
+        """Return extended forecast data, fetching only on a cache miss."""
+        entries: dict[str, dict[str, Any]] = hass.data.get(DOMAIN, {})
+        entry_id = call.data.get(ATTR_ENTRY_ID) or next(iter(entries), None)
+        if entry_id not in entries:
+            raise ServiceValidationError(
+                f"No loaded {DOMAIN} entry to fetch the forecast with"
+            )
+        fetcher: ForecastFetcher = entries[entry_id]["fetcher"]
+        latitude = call.data.get(CONF_LATITUDE, fetcher.latitude)
+        longitude = call.data.get(CONF_LONGITUDE, fetcher.longitude)
+        blocks = sorted(set(call.data[ATTR_BLOCKS]))
+        extended = call.data[ATTR_EXTENDED]
+
+        cache = get_service_cache(hass)
+        cell = fetcher.share_key(latitude, longitude)
+        if (cached := cache.get(cell, extended, frozenset(blocks))) is None:
+            payload = await fetcher.async_fetch_blocks(
+                latitude, longitude, frozenset(blocks), extended
+            )
+            cache.put(cell, extended, frozenset(blocks), payload)
+            cached = payload, time.time()
+        payload, fetched_at = cached
+        settings = entries[entry_id]["settings"]
+        return _response(
+            payload,
+            fetched_at,
+            blocks,
+            entry_units(hass, settings[CONF_UNIT_SYSTEM]),
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_FORECAST,
+        handle_get_forecast,
+        schema=SERVICE_GET_FORECAST_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,125 @@
+"""Local unit conversion of forecast values for an entry."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+from homeassistant.const import (
+    UnitOfLength,
+    UnitOfPrecipitationDepth,
+    UnitOfSpeed,
+    UnitOfTemperature,
+    UnitOfVolumetricFlux,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util.unit_conversion import (
+    DistanceConverter,
+    SpeedConverter,
+    TemperatureConverter,
+)
+from homeassistant.util.unit_system import (
+    METRIC_SYSTEM,
+    US_CUSTOMARY_SYSTEM,
+    UnitSystem,
+)
+
+from .const import UNIT_SYSTEM_METRIC, UNIT_SYSTEM_US
+
+# PirateWeather fields by the kind of quantity they hold, as fetched in the
+# canonical API_UNITS ("us")
+_TEMPERATURE_FIELDS = (
+    "temperature",
+    "apparentTemperature",
+    "dewPoint",
+    "temperatureHigh",
+    "temperatureLow",
+    "temperatureMin",
+    "temperatureMax",
+    "apparentTemperatureHigh",
+    "apparentTemperatureLow",
+    "apparentTemperatureMin",
+    "apparentTemperatureMax",
+)
+_SPEED_FIELDS = ("windSpeed", "windGust")
+_INTENSITY_FIELDS = ("precipIntensity", "precipIntensityMax", "precipIntensityError")
+_PRECIPITATION_FIELDS = ("precipAccumulation", "liquidAccumulation", "snowAccumulation")
+_DISTANCE_FIELDS = ("visibility", "nearestStormDistance")
+
+
+def entry_units(hass: HomeAssistant, unit_system: str) -> ForecastUnits:
+    """Return the units an entry displays forecast values in.
+
+    Entries set to follow Home Assistant pick up a change of its unit system
+    without being reloaded.
+    """
+    if unit_system == UNIT_SYSTEM_METRIC:
+        return _forecast_units(METRIC_SYSTEM)
+    if unit_system == UNIT_SYSTEM_US:
+        return _forecast_units(US_CUSTOMARY_SYSTEM)
+    return _forecast_units(hass.config.units)
+
+
+@lru_cache(maxsize=4)
+def _forecast_units(units: UnitSystem) -> ForecastUnits:
+    return ForecastUnits(units)
+
+
+class ForecastUnits:
+    """Convert canonical forecast values into the units of a unit system."""
+
+    def __init__(self, units: UnitSystem) -> None:
+        self.temperature_unit = units.temperature_unit
+        self.wind_speed_unit = units.wind_speed_unit
+        self.precipitation_unit = units.accumulated_precipitation_unit
+        self.intensity_unit = (
+            UnitOfVolumetricFlux.INCHES_PER_HOUR
+            if self.precipitation_unit == UnitOfPrecipitationDepth.INCHES
+            else UnitOfVolumetricFlux.MILLIMETERS_PER_HOUR
+        )
+        self.distance_unit = units.length_unit
+
+        self.temperature = TemperatureConverter.converter_factory(
+            UnitOfTemperature.FAHRENHEIT, self.temperature_unit
+        )
+        self.wind_speed = SpeedConverter.converter_factory(
+            UnitOfSpeed.MILES_PER_HOUR, self.wind_speed_unit
+        )
+        intensity = SpeedConverter.converter_factory(
+            UnitOfVolumetricFlux.INCHES_PER_HOUR, self.intensity_unit
+        )
+        precipitation = DistanceConverter.converter_factory(
+            UnitOfLength.INCHES, self.precipitation_unit
+        )
+        distance = DistanceConverter.converter_factory(
+            UnitOfLength.MILES, self.distance_unit
+        )
+        self._fields: dict[str, Callable[[float], float]] = {
+            **dict.fromkeys(_TEMPERATURE_FIELDS, self.temperature),
+            **dict.fromkeys(_SPEED_FIELDS, self.wind_speed),
+            **dict.fromkeys(_INTENSITY_FIELDS, intensity),
+            **dict.fromkeys(_PRECIPITATION_FIELDS, precipitation),
+            **dict.fromkeys(_DISTANCE_FIELDS, distance),
+        }
+
+    def convert_row(self, row: dict[str, Any]) -> dict[str, Any]:
+        """Return a copy of a PirateWeather data point in these units."""
+        return {
+            name: (
+                round(self._fields[name](value), 4)
+                if name in self._fields and isinstance(value, (int, float))
+                else value
+            )
+            for name, value in row.items()
+        }
+
+    def as_dict(self) -> dict[str, str]:
+        """Return the unit of each kind of value."""
+        return {
+            "temperature": self.temperature_unit,
+            "wind_speed": self.wind_speed_unit,
+            "precipitation_intensity": self.intensity_unit,
+            "precipitation": self.precipitation_unit,
+            "distance": self.distance_unit,
+        }
@@ -0,0 +1,53 @@
+"""Helpers for the Precipitation Radial Card integration."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Callable
+from typing import Any
+
+from .const import GRID_DEGREES
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - Home Assistant ships orjson
+    orjson = None
+
+# Fastest available decoder; both accept bytes or str
+json_loads: Callable[[bytes | str], Any] = (
+    orjson.loads if orjson is not None else json.loads
+)
+
+
+def api_key_id(api_key: str) -> str:
+    """Return a short id for an API key that does not reveal it."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+def grid_cell(latitude: float, longitude: float) -> tuple[int, int]:
+    """Return the index of the forecast grid cell containing a coordinate."""
+    return round(latitude / GRID_DEGREES), round(longitude / GRID_DEGREES)
+
+
+def grid_key(latitude: float, longitude: float) -> str:
+    """Return a string key for the grid cell containing a coordinate."""
+    row, col = grid_cell(latitude, longitude)
+    return f"{row},{col}"
+
+
+def grid_center(latitude: float, longitude: float) -> tuple[float, float]:
+    """Return the center of the grid cell containing a coordinate."""
+    row, col = grid_cell(latitude, longitude)
+    return round(row * GRID_DEGREES, 3), round(col * GRID_DEGREES, 3)
+
+
+def parse_coordinates(text: str) -> tuple[float, float]:
+    """Parse "latitude, longitude" in decimal degrees.
+
+    Raises ValueError for malformed or out-of-range coordinates.
+    """
+    latitude, longitude = (float(part) for part in text.split(","))
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        raise ValueError(f"Coordinates out of range: {text}")
+    return latitude, longitude
@@ -0,0 +1,152 @@
+"""Websocket API for the Precipitation Radial card."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DOMAIN, SIGNAL_ENTRY_UNLOADED, SIGNAL_LOCATION_NAME
+from .coordinator import BLOCK_HOURLY, BLOCK_MINUTELY, ForecastCoordinator
+from .forecast import PRECIP_TYPES, columns_delta
+
+TYPE_SUBSCRIBE = f"{DOMAIN}/subscribe"
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+def _resolve_entry_id(hass: HomeAssistant, msg: dict[str, Any]) -> str | None:
+    """Return the config entry targeted by a message."""
+    if entry_id := msg.get("entry_id"):
+        return entry_id
+    if entity_id := msg.get("entity_id"):
+        if (entity := er.async_get(hass).async_get(entity_id)) is not None:
+            return entity.config_entry_id
+        return None
+    entries = hass.data.get(DOMAIN, {})
+    return next(iter(entries), None)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): TYPE_SUBSCRIBE,
+        vol.Optional("entry_id"): str,
+        vol.Optional("entity_id"): str,
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Stream an entry's forecast as columnar arrays.
+
+    The first event carries the full payload; later events carry a delta for
+    one block when only part of its window changed, or the block in full.
+    Every event also carries the precomputed outlook of the blocks it covers.
+    When the entry is unloaded, a final "closed" event is sent and nothing
+    more follows, so the card subscribes again once the entry is back.
+    """
+    entry_id = _resolve_entry_id(hass, msg)
+    entry_data = hass.data.get(DOMAIN, {}).get(entry_id)
+    if entry_data is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Forecast entry not found"
+        )
+        return
+
+    coordinators: dict[str, ForecastCoordinator] = {
+        BLOCK_MINUTELY: entry_data["minutely"],
+        BLOCK_HOURLY: entry_data["hourly"],
+    }
+    sent: dict[str, dict[str, list]] = {
+        block: coordinator.columns for block, coordinator in coordinators.items()
+    }
+
+    @callback
+    def forward_block(block: str) -> None:
+        new = coordinators[block].columns
+        old = sent[block]
+        if new is old:
+            return
+        sent[block] = new
+        delta = columns_delta(old, new)
+        if delta is None:
+            event = {"type": "block", "block": block, "columns": new}
+        elif not delta["shift"] and not delta["index"] and delta["length"] == len(
+            old["time"]
+        ):
+            return
+        else:
+            event = {"type": "delta", "block": block, **delta}
+        event["outlook"] = coordinators[block].outlook
+        connection.send_message(websocket_api.event_message(msg["id"], event))
+
+    @callback
+    def forward_location(location_name: str) -> None:
+        connection.send_message(
+            websocket_api.event_message(
+                msg["id"], {"type": "location", "location_name": location_name}
+            )
+        )
+
+    unsubs = [
+        coordinator.async_add_listener(lambda block=block: forward_block(block))
+        for block, coordinator in coordinators.items()
+    ]
+    unsubs.append(
+        entry_data["minutely"].async_add_window_listener(
+            lambda: forward_block(BLOCK_MINUTELY)
+        )
+    )
+    unsubs.append(
+        async_dispatcher_connect(
+            hass, SIGNAL_LOCATION_NAME.format(entry_id), forward_location
+        )
+    )
+
+    @callback
+    def unsubscribe() -> None:
+        for unsub in unsubs:
+            unsub()
+        unsubs.clear()
+
+    @callback
+    def close() -> None:
+        # Stays registered, as a no-op, so the card can still unsubscribe
+        unsubscribe()
+        connection.send_message(
+            websocket_api.event_message(msg["id"], {"type": "closed"})
+        )
+
+    unsubs.append(
+        async_dispatcher_connect(hass, SIGNAL_ENTRY_UNLOADED.format(entry_id), close)
+    )
+
+    connection.subscriptions[msg["id"]] = unsubscribe
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(
+            msg["id"],
+            {
+                "type": "full",
+                "precip_types": PRECIP_TYPES,
+                "location_name": entry_data.get("location_name", ""),
+                **sent,
+                "outlook": {
+                    block: coordinator.outlook
+                    for block, coordinator in coordinators.items()
+                },
+            },
+        )
+    )
@@ -1,3 +1,15 @@
+// Ring colors by precipitation bucket (0 = none), as computed by the integration
+const PRECIP_COLORS = [
+  'var(--disabled-text-color, #cccccc)',
+  '#AED581',
+  '#9CCC65',
+  '#66BB6A',
+  '#FFEE58',
+  '#FFCA28',
+  '#FF7043',
+  '#E53935',
+];
+
 class PrecipitationRadialCard extends HTMLElement {
   constructor() {
     super();
@@ -19,6 +31,8 @@ class PrecipitationRadialCard extends HTMLElement {
     this._lastFrameTime = 0;
     this._lightningBolts = [];
     this._nextStrikeTime = 0;
+    this._forecast = null;
+    this._forecastSub = null;
     this._iconMap = {
       'clear-day': 'wi-sunny',
       'clear-night': 'wi-moon',
@@ -69,6 +83,7 @@ class PrecipitationRadialCard extends HTMLElement {
     if (!this._resolved) {
       this._autoDiscover(hass);
     }
+    this._subscribeForecast(hass);
     if (this._hasRelevantStateChanged(hass)) {
       this._updateCard(hass);
     }
@@ -104,6 +119,105 @@ class PrecipitationRadialCard extends HTMLElement {
     return this._hass;
   }
 
+  // Forecast rows arrive over the integration's websocket subscription as
+  // parallel arrays (full payload first, then per-block deltas). A failed
+  // subscribe is retried with exponential backoff (2 s doubling up to 5 min)
+  // on later hass updates, not on every one.
+  _subscribeForecast(hass) {
+    if (this._forecastSub || !this._resolved || !hass?.connection) return;
+    if (this._config.preview_minutely && this._config.preview_hourly) return;
+    if (Date.now() < (this._forecastRetryAt || 0)) return;
+    const sub = hass.connection.subscribeMessage(
+      (msg) => this._handleForecastMessage(msg),
+      { type: 'precipitation_radial/subscribe', entity_id: this._config.entity_minutely },
+    );
+    this._forecastSub = sub;
+    sub.then(() => {
+      this._forecastFailures = 0;
+      this._forecastRetryAt = 0;
+    }, (err) => {
+      console.error('Precipitation Radial: forecast subscription failed', err);
+      if (this._forecastSub === sub) this._forecastSub = null;
+      this._forecastFailures = (this._forecastFailures || 0) + 1;
+      this._forecastRetryAt = Date.now() + Math.min(1000 * 2 ** this._forecastFailures, 300000);
+    });
+  }
+
+  _unsubscribeForecast() {
+    if (!this._forecastSub) return;
+    this._forecastSub.then((unsub) => unsub()).catch(() => {});
+    this._forecastSub = null;
+    this._forecast = null;
+  }
+
+  _handleForecastMessage(msg) {
+    if (msg.type === 'closed') {
+      // The entry was unloaded or reloaded; subscribe again on the next update
+      this._unsubscribeForecast();
+    } else if (msg.type === 'full') {
+      this._forecast = {
+        precipTypes: msg.precip_types || [],
+        locationName: msg.location_name || '',
+        minutely: msg.minutely || {},
+        hourly: msg.hourly || {},
+        outlook: msg.outlook || {},
+      };
+    } else if (!this._forecast) {
+      return;
+    } else if (msg.type === 'block') {
+      this._forecast[msg.block] = msg.columns;
+      this._forecast.outlook[msg.block] = msg.outlook;
+    } else if (msg.type === 'delta') {
+      this._forecast[msg.block] = this._applyColumnsDelta(this._forecast[msg.block], msg);
+      this._forecast.outlook[msg.block] = msg.outlook;
+    } else if (msg.type === 'location') {
+      this._forecast.locationName = msg.location_name || '';
+    }
+    if (this._hass) this._updateCard(this._hass);
+  }
+
+  _applyColumnsDelta(columns, delta) {
+    const result = {};
+    for (const [col, values] of Object.entries(columns || {})) {
+      result[col] = values.slice(delta.shift, delta.shift + delta.length);
+    }
+    delta.index.forEach((rowIdx, i) => {
+      for (const [col, values] of Object.entries(delta.values)) {
+        if (!result[col]) result[col] = [];
+        result[col][rowIdx] = values[i];
+      }
+    });
+    return result;
+  }
+
+  _minutelyRows() {
+    const cols = this._forecast?.minutely;
+    if (!cols?.time) return [];
+    const types = this._forecast.precipTypes;
+    return cols.time.map((time, i) => ({
+      time,
+      precipIntensity: cols.intensity[i],
+      precipProbability: cols.probability[i],
+      precipIntensityError: cols.error[i],
+      precipType: types[cols.type[i]] || 'none',
+      color: cols.color?.[i],
+    }));
+  }
+
+  _hourlyRows() {
+    const cols = this._forecast?.hourly;
+    if (!cols?.time) return [];
+    return cols.time.map((time, i) => ({
+      time,
+      icon: cols.icon[i],
+      summary: cols.summary[i],
+      temperature: cols.temperature[i],
+      precipIntensity: cols.intensity[i],
+      precipProbability: cols.probability[i],
+      color: cols.color?.[i],
+    }));
+  }
+
   _autoDiscover(hass) {
     const states = hass.states;
     const prefix = 'sensor.precipitation_radial_';
@@ -180,6 +294,12 @@ class PrecipitationRadialCard extends HTMLElement {
     return this._localize('ui.card.weather.precipitation', 'Precipitation');
   }
 
+  // Wind thresholds are in mph; the wind sensor reports in its own unit
+  _windSpeedMph(speed, unit) {
+    const toMph = { 'km/h': 0.621371, 'm/s': 2.236936, 'kn': 1.150779, 'ft/s': 0.681818 };
+    return speed * (toMph[unit] ?? 1);
+  }
+
   _getIntensityDescription(intensity, precipType = 'Rain') {
     const typeStr = typeof precipType === 'string' ? precipType : this._getPrecipTypeFromIcon(null);
 
@@ -190,160 +310,117 @@ class PrecipitationRadialCard extends HTMLElement {
     return typeStr;
   }
 
-  _getCombinedWeatherSummary(minutelyData, hourlyData) {
-    let actualStartsIn = -1;
-    let actualSpellDuration = -1;
-    let actualEndsIn = -1;
-    let isCurrentlyPrecipitating = false;
-    let maxIntensityMinutely = 0;
+  // Same outlook the integration precomputes for live data (forecast.py);
+  // only needed for preview data generated in the card.
+  _computeOutlook(minutelyData, hourlyData) {
+    const wet = (minutelyData || []).map((d) => this._isPrecip(d));
+    const count = wet.length;
+    const ongoing = count > 0 && wet[0];
+    let startsIn = null;
+    let endsIn = null;
+    let duration = null;
+    let spellStart = -1;
+    for (let i = 0; i <= count; i++) {
+      if (i < count && wet[i]) {
+        if (spellStart === -1) spellStart = i;
+        if (ongoing && endsIn === null && !wet.slice(i + 1, i + 6).some(Boolean)) {
+          endsIn = i + 1;
+        }
+        continue;
+      }
+      if (spellStart !== -1 && !ongoing && startsIn === null) {
+        startsIn = spellStart;
+        duration = i - spellStart;
+      }
+      spellStart = -1;
+    }
 
-    const firstHourIconKey = hourlyData?.[0]?.icon || '';
-    let currentPrecipType = this._getPrecipTypeFromIcon(firstHourIconKey);
+    let peak = 0;
+    const nowTypes = [];
+    wet.forEach((isWet, i) => {
+      if (!isWet) return;
+      peak = Math.max(peak, parseFloat(minutelyData[i].precipIntensity) || 0);
+      if (i < 15) nowTypes.push((minutelyData[i].precipType || 'rain').toLowerCase());
+    });
+    const peakNow = (minutelyData || []).slice(0, 15).reduce((mx, d) =>
+      Math.max(mx, parseFloat(d.precipIntensity) || 0), 0);
+    let typeNow = null;
+    if (nowTypes.length > 0) {
+      const counts = {};
+      for (const t of nowTypes) if (t !== 'none') counts[t] = (counts[t] || 0) + 1;
+      typeNow = Object.keys(counts).sort((a, b) => counts[b] - counts[a])[0] || 'none';
+    }
 
-    if (minutelyData && minutelyData.length > 0) {
-      if (this._isPrecip(minutelyData[0])) {
-        isCurrentlyPrecipitating = true;
-        maxIntensityMinutely = Math.max(maxIntensityMinutely, parseFloat(minutelyData[0].precipIntensity) || 0);
-      }
+    let precipHours = 1;
+    for (let h = 1; h < (hourlyData || []).length; h++) {
+      if (!this._isPrecip(hourlyData[h])) break;
+      precipHours++;
+    }
 
-      let firstPrecipMinuteInSpell = -1;
-      let lastPrecipMinuteInSpell = -1;
+    return {
+      minutely: {
+        ongoing, starts_in: startsIn, ends_in: endsIn, duration, peak, peak_now: peakNow, type_now: typeNow,
+      },
+      hourly: { precip_hours: precipHours },
+    };
+  }
 
-      for (let i = 0; i < minutelyData.length; i++) {
-        if (this._isPrecip(minutelyData[i])) {
-          if (firstPrecipMinuteInSpell === -1) {
-            firstPrecipMinuteInSpell = i;
-          }
-          lastPrecipMinuteInSpell = i;
-          maxIntensityMinutely = Math.max(maxIntensityMinutely, parseFloat(minutelyData[i].precipIntensity) || 0);
-
-          if (isCurrentlyPrecipitating && actualEndsIn === -1) {
-            let drySpellFound = true;
-            for (let k = 0; k < 5; k++) {
-              const checkIdx = i + 1 + k;
-              // Past end of data counts as dry (rain ended within the window)
-              if (checkIdx >= minutelyData.length) break;
-              if (this._isPrecip(minutelyData[checkIdx])) {
-                drySpellFound = false;
-                break;
-              }
-            }
-            if (drySpellFound) {
-              actualEndsIn = i + 1;
-            } else if (i === minutelyData.length - 1) {
-              actualEndsIn = minutelyData.length;
-            }
-          }
-        } else {
-          if (firstPrecipMinuteInSpell !== -1) {
-            if (!isCurrentlyPrecipitating && actualStartsIn === -1) {
-              actualStartsIn = firstPrecipMinuteInSpell;
-              actualSpellDuration = (lastPrecipMinuteInSpell - firstPrecipMinuteInSpell) + 1;
-            }
-            firstPrecipMinuteInSpell = -1;
-          }
-        }
-      }
+  // Outlook from the integration, with type codes resolved to names
+  _liveOutlook() {
+    const outlook = this._forecast?.outlook;
+    if (!outlook?.minutely || !outlook?.hourly) return null;
+    const types = this._forecast.precipTypes;
+    const typeNow = outlook.minutely.type_now;
+    return {
+      minutely: { ...outlook.minutely, type_now: typeNow == null ? null : (types[typeNow] || 'none') },
+      hourly: outlook.hourly,
+    };
+  }
 
-      if (firstPrecipMinuteInSpell !== -1) {
-          if (!isCurrentlyPrecipitating && actualStartsIn === -1) {
-            actualStartsIn = firstPrecipMinuteInSpell;
-            actualSpellDuration = (lastPrecipMinuteInSpell - firstPrecipMinuteInSpell) + 1;
-          } else if (isCurrentlyPrecipitating && actualEndsIn === -1) {
-            actualEndsIn = minutelyData.length;
-          }
-      }
-    }
+  _getCombinedWeatherSummary(minutelyData, hourlyData, outlook) {
+    const { ongoing, starts_in: startsIn, ends_in: endsIn, duration, peak } = outlook.minutely;
+    const firstHourIconKey = hourlyData?.[0]?.icon || '';
+    const intensityDesc = this._getIntensityDescription(peak, this._getPrecipTypeFromIcon(firstHourIconKey));
 
-    const intensityDesc = this._getIntensityDescription(maxIntensityMinutely, currentPrecipType);
-
-    if (isCurrentlyPrecipitating) {
-      if (actualEndsIn !== -1 && actualEndsIn > 0) {
-        // If rain extends to end of minutely window, check hourly data for duration
-        if (actualEndsIn >= minutelyData.length - 1 && hourlyData && hourlyData.length > 1) {
-          // Count consecutive hours with precipitation starting from hour 1
-          // (hour 0 overlaps with the minutely window)
-          let rainyHours = 1; // at least 1 hour (the minutely window)
-          for (let h = 1; h < hourlyData.length; h++) {
-            if (this._isPrecip(hourlyData[h])) {
-              rainyHours++;
-            } else {
-              break;
-            }
-          }
+    if (ongoing) {
+      if (endsIn !== null && endsIn > 0) {
+        // If rain extends to end of minutely window, use the hourly forecast for duration
+        if (endsIn >= minutelyData.length - 1 && hourlyData && hourlyData.length > 1) {
+          const rainyHours = outlook.hourly.precip_hours;
           if (rainyHours >= 2) {
             return `${intensityDesc} expected for the next ${rainyHours} hours`;
           }
         }
-        return this._localize('ui.card.precipitation_radial.precip_ending_in', `${intensityDesc} ending in {actual_ends_in} min`, {actual_ends_in: actualEndsIn});
+        return this._localize('ui.card.precipitation_radial.precip_ending_in', `${intensityDesc} ending in {actual_ends_in} min`, {actual_ends_in: endsIn});
       }
       return this._localize('ui.card.precipitation_radial.precip_ongoing', `${intensityDesc} ongoing`, {});
     }
 
-    if (actualStartsIn !== -1 && actualStartsIn >= 0) {
+    if (startsIn !== null) {
       let msg = this._localize('ui.card.precipitation_radial.precip_starting_in', `${intensityDesc} starting in {actual_starts_in} min`, {
-        actual_starts_in: actualStartsIn
+        actual_starts_in: startsIn
       });
-      if (actualSpellDuration !== -1 && actualSpellDuration > 0) {
+      if (duration !== null && duration > 0) {
         msg += this._localize('ui.card.precipitation_radial.precip_for_duration', `, for {actual_spell_duration} min`, {
-          actual_spell_duration: actualSpellDuration
+          actual_spell_duration: duration
         });
       }
       return msg;
     }
 
-    // Fallback: if any minutely data point would show as colored on the ring,
-    // mention precipitation even if the spell detection didn't find a clean pattern
-    if (minutelyData && minutelyData.length > 0) {
-      let hasAnyPrecip = false;
-      let maxFallbackIntensity = 0;
-      let firstPrecipIdx = -1;
-      let lastPrecipIdx = -1;
-      for (let i = 0; i < minutelyData.length; i++) {
-        if (this._isPrecip(minutelyData[i])) {
-          hasAnyPrecip = true;
-          const inten = parseFloat(minutelyData[i].precipIntensity) || 0;
-          if (inten > maxFallbackIntensity) maxFallbackIntensity = inten;
-          if (firstPrecipIdx === -1) firstPrecipIdx = i;
-          lastPrecipIdx = i;
-        }
-      }
-      if (hasAnyPrecip) {
-        const fallbackDesc = this._getIntensityDescription(maxFallbackIntensity, currentPrecipType);
-        if (firstPrecipIdx === 0) {
-          return `${fallbackDesc} expected`;
-        }
-        return this._localize('ui.card.precipitation_radial.precip_starting_in', `${fallbackDesc} starting in {actual_starts_in} min`, {
-          actual_starts_in: firstPrecipIdx
-        });
-      }
-    }
-
     const weatherCondition = hourlyData?.[0]?.summary || this._localize('ui.card.weather.unavailable', 'Weather data unavailable');
     return weatherCondition;
   }
 
-  _getCurrentConditions(minutelyData, hourlyData) {
+  _getCurrentConditions(hourlyData, outlook) {
     const currentHourIconKey = hourlyData?.[0]?.icon || '';
     // Sky condition from hourly icon (what the sky looks like)
     const sky = this._iconMap[currentHourIconKey] ? currentHourIconKey : 'cloudy';
 
-    // Precipitation condition from minutely data (what's falling)
-    const recentMinutely = minutelyData?.slice(0, 15) || [];
-    const precipMinutes = recentMinutely.filter(d => this._isPrecip(d));
+    // Precipitation condition from the next 15 minutes (what's falling)
+    const dominant = outlook.minutely.type_now;
     let precip = null;
-
-    if (precipMinutes.length > 0) {
-      const typeCounts = {};
-      for (const d of precipMinutes) {
-        const pt = (d.precipType || 'rain').toLowerCase();
-        typeCounts[pt] = (typeCounts[pt] || 0) + 1;
-      }
-      let dominant = 'rain';
-      let maxCount = 0;
-      for (const [type, count] of Object.entries(typeCounts)) {
-        if (count > maxCount && type !== 'none') { dominant = type; maxCount = count; }
-      }
+    if (dominant !== null) {
       if (currentHourIconKey.includes('thunderstorm')) precip = 'thunderstorm';
       else if (dominant === 'snow') precip = 'snow';
       else if (dominant === 'sleet') precip = 'sleet';
@@ -355,8 +432,8 @@ class PrecipitationRadialCard extends HTMLElement {
   }
 
   // Keep for icon display — picks the most relevant single condition
-  _getCurrentOverallIconKey(minutelyData, hourlyData) {
-    const { sky, precip } = this._getCurrentConditions(minutelyData, hourlyData);
+  _getCurrentOverallIconKey(hourlyData, outlook) {
+    const { sky, precip } = this._getCurrentConditions(hourlyData, outlook);
     return precip || sky;
   }
 
@@ -369,21 +446,22 @@ class PrecipitationRadialCard extends HTMLElement {
     return `${hour12}${ampm.substring(0,1)}`;
   }
 
-  _getColorForPrecip(intensity = 0, probability = 0) {
+  // Live rows carry the bucket precomputed by the integration; preview rows
+  // are bucketed here with the same limits.
+  _getColorForPrecip(intensity = 0, probability = 0, bucket = undefined) {
+    if (Number.isInteger(bucket)) return PRECIP_COLORS[bucket] || PRECIP_COLORS[0];
+
     const numIntensity = parseFloat(intensity) || 0;
     const numProbability = parseFloat(probability) || 0;
 
-    if (numProbability < 0.10 || numIntensity < 0.005) {
-        return 'var(--disabled-text-color, #cccccc)';
-    }
-
-    if (numIntensity < 0.01) return '#AED581';
-    if (numIntensity < 0.05) return '#9CCC65';
-    if (numIntensity < 0.15) return '#66BB6A';
-    if (numIntensity < 0.30) return '#FFEE58';
-    if (numIntensity < 0.60) return '#FFCA28';
-    if (numIntensity < 1.0) return '#FF7043';
-    return '#E53935';
+    if (numProbability < 0.10 || numIntensity < 0.005) return PRECIP_COLORS[0];
+    if (numIntensity < 0.01) return PRECIP_COLORS[1];
+    if (numIntensity < 0.05) return PRECIP_COLORS[2];
+    if (numIntensity < 0.15) return PRECIP_COLORS[3];
+    if (numIntensity < 0.30) return PRECIP_COLORS[4];
+    if (numIntensity < 0.60) return PRECIP_COLORS[5];
+    if (numIntensity < 1.0) return PRECIP_COLORS[6];
+    return PRECIP_COLORS[7];
   }
 
   _generatePreviewMinutely(segments) {
@@ -453,8 +531,13 @@ class PrecipitationRadialCard extends HTMLElement {
     return data;
   }
 
+  connectedCallback() {
+    if (this._hass) this._subscribeForecast(this._hass);
+  }
+
   disconnectedCallback() {
     this._stopAnimation();
+    this._unsubscribeForecast();
   }
 
   _stopAnimation() {
@@ -1395,20 +1478,24 @@ class PrecipitationRadialCard extends HTMLElement {
     }
 
     const entityMinutely = hass.states[config.entity_minutely];
-    const entityHourly = hass.states[config.entity_hourly];
-    let minutelyData = entityMinutely?.attributes?.data || [];
-    let hourlyData = entityHourly?.attributes?.data || [];
+    let minutelyData = this._minutelyRows();
+    let hourlyData = this._hourlyRows();
+    let outlook = this._liveOutlook();
 
     // Preview mode: generate fake minutely data if preview_minutely is set
     if (config.preview_minutely && Array.isArray(config.preview_minutely)) {
       minutelyData = this._generatePreviewMinutely(config.preview_minutely);
+      outlook = null;
     }
 
     // Preview mode: generate fake hourly data if preview_hourly is set
     if (config.preview_hourly && Array.isArray(config.preview_hourly)) {
       hourlyData = this._generatePreviewHourly(config.preview_hourly);
+      outlook = null;
     }
 
+    if (!outlook) outlook = this._computeOutlook(minutelyData, hourlyData);
+
     const currentTempRaw = hass.states[config.entity_current_temperature]?.state;
     const currentTemp = currentTempRaw && !['unavailable', 'unknown'].includes(currentTempRaw)
       ? parseFloat(currentTempRaw).toFixed(1) : 'N/A';
@@ -1431,7 +1518,7 @@ class PrecipitationRadialCard extends HTMLElement {
     const tempUnit = typeof tempUnitRaw === 'string' ? tempUnitRaw : '';
     const windUnit = hass.states[config.entity_wind_speed]?.attributes?.unit_of_measurement || '';
 
-    const locationName = entityMinutely?.attributes?.location_name || '';
+    const locationName = this._forecast?.locationName || entityMinutely?.attributes?.location_name || '';
 
     let overallIconKey;
     let combinedSummary;
@@ -1444,9 +1531,9 @@ class PrecipitationRadialCard extends HTMLElement {
         combinedSummary = config.preview_condition.replace(/-/g, ' ').replace(/\b\w/g, c => c.toUpperCase());
       }
     } else {
-      overallIconKey = this._getCurrentOverallIconKey(minutelyData, hourlyData);
+      overallIconKey = this._getCurrentOverallIconKey(hourlyData, outlook);
       try {
-        combinedSummary = this._getCombinedWeatherSummary(minutelyData, hourlyData);
+        combinedSummary = this._getCombinedWeatherSummary(minutelyData, hourlyData, outlook);
       } catch (e) {
         console.error('Precipitation Radial: error generating summary', e);
         combinedSummary = hourlyData?.[0]?.summary || 'Weather data unavailable';
@@ -1912,7 +1999,7 @@ class PrecipitationRadialCard extends HTMLElement {
       line.setAttribute("y2", y2);
       line.setAttribute("stroke-width", barWidth + 0.5);
       line.setAttribute("stroke-linecap", "butt");
-      line.setAttribute("stroke", this._getColorForPrecip(minute.precipIntensity, minute.precipProbability));
+      line.setAttribute("stroke", this._getColorForPrecip(minute.precipIntensity, minute.precipProbability, minute.color));
       svg.appendChild(line);
     });
 
@@ -1980,7 +2067,7 @@ class PrecipitationRadialCard extends HTMLElement {
       precipTick.setAttribute("cx", tickX);
       precipTick.setAttribute("cy", tickY);
       precipTick.setAttribute("r", hourTickRadius);
-      precipTick.setAttribute("fill", this._getColorForPrecip(data.precipIntensity, data.precipProbability));
+      precipTick.setAttribute("fill", this._getColorForPrecip(data.precipIntensity, data.precipProbability, data.color));
       svg.appendChild(precipTick);
 
       const labelX = centerX + hourLabelRadius * Math.cos(angleForThisForecast);
@@ -2034,12 +2121,13 @@ class PrecipitationRadialCard extends HTMLElement {
       }
       intensityFactor = 0.5;
     } else {
-      ({ sky, precip } = this._getCurrentConditions(minutelyData, hourlyData));
-      const maxIntensity = minutelyData.slice(0, 15).reduce((mx, d) =>
-        Math.max(mx, parseFloat(d.precipIntensity) || 0), 0);
+      ({ sky, precip } = this._getCurrentConditions(hourlyData, outlook));
+      const maxIntensity = outlook.minutely.peak_now;
       intensityFactor = Math.min(1, Math.sqrt(Math.min(maxIntensity, 1)));
     }
-    const windSpeedNum = parseFloat(windSpeedRaw) || 0;
+    const windSpeedNum = config.preview_wind_speed != null
+      ? parseFloat(windSpeedRaw) || 0
+      : this._windSpeedMph(parseFloat(windSpeedRaw) || 0, windUnit);
     // Wind as independent overlay: 0-10 mph = none, 10-33 mph = scales 0→1, 33+ capped
     const windFactor = windSpeedNum <= 10 ? 0 : Math.min(1, (windSpeedNum - 10) / 23);
 